@@ -5,19 +5,40 @@ Treina modelos YOLO com configurações flexíveis.
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
-# Adicionar src ao path PRIMEIRO
-ROOT = Path(__file__).resolve().parent.parent
-sys.path.append(str(ROOT))
-
-# Agora importar os módulos locais
-from src.data.validators import quick_validate
-from src.yolo import YOLOConfig, YOLOTrainer, TrainingConfig, AugmentationConfig
-from src.core.config import config
 from loguru import logger
 
+# Módulos locais (src.yolo, src.data) são importados sob demanda para que
+# `--help` e erros de argumentos não paguem o import de torch/ultralytics.
+# Requer `pip install -e .` na raiz do projeto.
+
+
+# Parâmetros zerados quando augmentation está desabilitada
+_AUG_ZERO = dict.fromkeys(
+    ('hsv_h', 'hsv_s', 'hsv_v', 'degrees', 'translate', 'scale',
+     'shear', 'perspective', 'flipud', 'fliplr', 'mosaic', 'mixup',
+     'copy_paste', 'auto_augment', 'erasing'),
+    0.0
+)
+
+# Chaves do YAML que não são aceitas pelo Ultralytics
+_INVALID_PARAMS = frozenset({'augmentation', 'augmentations'})
+
+# Extensões de imagem consideradas no dimensionamento/aquecimento do cache
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png'})
+
+# Argumentos de linha de comando que sobrescrevem a configuração
+_OVERRIDE_KEYS = ('model', 'epochs', 'batch', 'imgsz', 'device', 'workers',
+                  'lr0', 'lrf', 'momentum', 'weight_decay',
+                  'patience', 'save_period', 'project', 'name')
+
+# Parâmetros verificados para indicar se há augmentation ativa
+_AUG_CHECK_PARAMS = ('hsv_h', 'hsv_s', 'hsv_v', 'degrees', 'translate',
+                     'scale', 'mosaic', 'mixup', 'fliplr')
+
 
 def parse_arguments():
     """Parse argumentos da linha de comando."""
@@ -66,7 +87,26 @@ def parse_arguments():
     parser.add_argument('--patience', type=int, help='Early stopping patience')
     parser.add_argument('--save-period', type=int,
                         help='Período para salvar checkpoints')
-    parser.add_argument('--cache', action='store_true', help='Cache imagens')
+    parser.add_argument(
+        '--cache',
+        nargs='?',
+        const='auto',
+        choices=['ram', 'disk', 'auto'],
+        help='Cache de imagens (auto escolhe ram/disk pela memória livre)'
+    )
+
+    parser.add_argument(
+        '--precache-workers',
+        type=int,
+        default=16,
+        help='Threads para pré-carregar imagens no page cache (0 desativa)'
+    )
+
+    parser.add_argument(
+        '--pin-cpu',
+        action='store_true',
+        help='Fixa afinidade de CPU (workers + 1 núcleos) e 1 thread OpenMP/MKL'
+    )
 
     # Augmentation
     parser.add_argument(
@@ -107,6 +147,8 @@ def parse_arguments():
 
 def validate_dataset(data_path: Path) -> bool:
     """Valida dataset antes do treinamento."""
+    from src.data.validators import quick_validate
+
     logger.info("🔍 Validando dataset...")
 
     is_valid = quick_validate(str(data_path))
@@ -119,6 +161,106 @@ def validate_dataset(data_path: Path) -> bool:
         return False
 
 
+@lru_cache(maxsize=32)
+def _resolve_data_yaml(data_path: str) -> Optional[str]:
+    """Retorna o caminho do data.yaml dentro do dataset, ou None."""
+    data_yaml = Path(data_path) / "data.yaml"
+    return str(data_yaml) if data_yaml.is_file() else None
+
+
+def collect_overrides(args) -> Dict:
+    """Coleta os overrides fornecidos na linha de comando (ignora None)."""
+    return {key: value for key in _OVERRIDE_KEYS
+            if (value := getattr(args, key, None)) is not None}
+
+
+@lru_cache(maxsize=4)
+def _list_dataset_images(data_path: Path) -> Tuple[Path, ...]:
+    """Imagens do dataset (uma única varredura, compartilhada entre dimensionamento e aquecimento)."""
+    return tuple(f for f in data_path.rglob('*')
+                 if f.suffix.lower() in _IMAGE_EXTENSIONS)
+
+
+def resolve_cache_mode(cache: Optional[str], data_path: Path) -> Optional[str]:
+    """
+    Resolve o modo de cache do Ultralytics.
+
+    Em modo 'auto', compara o tamanho das imagens do dataset com a memória
+    disponível e usa 'ram' apenas se couber com 20% de folga.
+    """
+    if cache != 'auto':
+        return cache
+
+    try:
+        import psutil
+    except ImportError:
+        logger.warning("⚠️ psutil não instalado - usando cache em disco")
+        return 'disk'
+
+    dataset_bytes = sum(f.stat().st_size for f in _list_dataset_images(data_path))
+    available = psutil.virtual_memory().available
+    mode = 'ram' if dataset_bytes * 1.2 < available else 'disk'
+
+    logger.info(
+        f"💾 Cache automático: {mode} "
+        f"(dataset {dataset_bytes / 1024**3:.2f}GB, "
+        f"RAM livre {available / 1024**3:.2f}GB)")
+    return mode
+
+
+def warm_page_cache(data_path: Path, workers: int) -> None:
+    """
+    Lê as imagens do dataset em paralelo para aquecer o page cache do SO.
+
+    Assim o cache do Ultralytics na primeira época fica limitado por CPU
+    (decode/resize) e não por latência de disco. Só faz sentido com cache
+    em RAM: no modo 'disk' o dataset não cabe na memória livre.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = _list_dataset_images(data_path)
+    if not paths:
+        return
+
+    logger.info(
+        f"🔥 Aquecendo page cache: {len(paths)} imagens ({workers} threads)")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Retorna só o tamanho para não reter os bytes nos futures
+        for _ in executor.map(lambda p: len(p.read_bytes()), paths):
+            pass
+
+
+def pin_cpu_affinity(n_cpus: int) -> None:
+    """
+    Restringe o processo (e os workers do DataLoader, que herdam a máscara)
+    aos primeiros `n_cpus` núcleos e limita OpenMP/MKL a 1 thread por processo.
+
+    Deve ser chamado antes de importar torch para que os limites de threads
+    tenham efeito.
+    """
+    import os
+
+    os.environ.setdefault('OMP_NUM_THREADS', '1')
+    os.environ.setdefault('MKL_NUM_THREADS', '1')
+
+    if hasattr(os, 'sched_setaffinity'):
+        available = sorted(os.sched_getaffinity(0))
+        cpus = set(available[:max(1, n_cpus)])
+        os.sched_setaffinity(0, cpus)
+    else:
+        try:
+            import psutil
+        except ImportError:
+            logger.warning(
+                "⚠️ Afinidade de CPU não suportada (instale psutil)")
+            return
+        process = psutil.Process()
+        cpus = set(process.cpu_affinity()[:max(1, n_cpus)])
+        process.cpu_affinity(sorted(cpus))
+
+    logger.info(f"📌 Afinidade de CPU: {sorted(cpus)}")
+
+
 def create_training_config(args) -> Dict:
     """Cria configuração de treinamento a partir do YAML."""
     import yaml
@@ -132,49 +274,36 @@ def create_training_config(args) -> Dict:
             raise FileNotFoundError(
                 f"Arquivo de configuração não encontrado: {config_path}")
 
-        # Carregar YAML
+        # Carregar YAML (usa o loader em C da libyaml quando disponível)
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
         with open(config_path, 'r', encoding='utf-8') as f:
-            training_config = yaml.safe_load(f)
+            training_config = yaml.load(f, Loader=loader)
 
-        invalid_params = ['augmentation', 'augmentations']
         augmentation_enabled = training_config.get('augmentation', True)
 
-        for param in invalid_params:
-            if param in training_config:
-                logger.debug(
-                    f"🔧 Removendo parâmetro inválido: {param}={training_config[param]}")
-                del training_config[param]
+        for param in _INVALID_PARAMS & training_config.keys():
+            logger.debug(
+                f"🔧 Removendo parâmetro inválido: {param}={training_config[param]}")
+            del training_config[param]
 
         # Se augmentation estava desabilitado, zerar os parâmetros de augmentation
         if not augmentation_enabled:
             logger.info("🎨 Augmentations DESABILITADAS - zerando parâmetros")
-            aug_params = ['hsv_h', 'hsv_s', 'hsv_v', 'degrees', 'translate', 'scale',
-                          'shear', 'perspective', 'flipud', 'fliplr', 'mosaic', 'mixup',
-                          'copy_paste', 'auto_augment', 'erasing']
-            for param in aug_params:
-                training_config[param] = 0.0
+            training_config.update(_AUG_ZERO)
 
         # Sobrescrever data path se fornecido
         if args.data_path:
             # Procurar data.yaml no dataset
-            data_path = Path(args.data_path)
-            data_yaml = data_path / "data.yaml"
-            if data_yaml.exists():
-                training_config['data'] = str(data_yaml)
+            data_yaml = _resolve_data_yaml(args.data_path)
+            if data_yaml:
+                training_config['data'] = data_yaml
             else:
-                logger.warning(f"⚠️ data.yaml não encontrado em {data_path}")
+                logger.warning(
+                    f"⚠️ data.yaml não encontrado em {args.data_path}")
 
         # Aplicar overrides da linha de comando
-        overrides = {}
-        override_keys = ['model', 'epochs', 'batch', 'imgsz', 'device', 'workers',
-                         'lr0', 'lrf', 'momentum', 'weight_decay',
-                         'patience', 'save_period', 'project', 'name']
-
-        for key in override_keys:
-            value = getattr(args, key, None)
-            if value is not None:
-                overrides[key] = value
-                training_config[key] = value
+        overrides = collect_overrides(args)
+        training_config.update(overrides)
 
         if overrides:
             logger.info(f"🔧 Aplicando overrides: {overrides}")
@@ -185,15 +314,12 @@ def create_training_config(args) -> Dict:
                 f"🎨 Aplicando preset de augmentation: {args.augmentation}")
             if args.augmentation == 'disabled':
                 # Desabilitar todas as augmentations
-                aug_params = ['hsv_h', 'hsv_s', 'hsv_v', 'degrees', 'translate', 'scale',
-                              'shear', 'perspective', 'flipud', 'fliplr', 'mosaic', 'mixup',
-                              'copy_paste', 'auto_augment', 'erasing']
-                for param in aug_params:
-                    training_config[param] = 0.0
+                training_config.update(_AUG_ZERO)
 
         # Aplicar cache
         if args.cache:
-            training_config['cache'] = True
+            training_config['cache'] = resolve_cache_mode(
+                args.cache, Path(args.data_path))
 
         return training_config
 
@@ -201,6 +327,7 @@ def create_training_config(args) -> Dict:
     elif args.preset:
         logger.info(f"⚙️ Criando configuração com preset: {args.preset}")
 
+        from src.yolo import TrainingConfig, YOLOConfig
         from src.yolo.presets import yolo_presets
 
         # Obter configuração base do preset
@@ -213,38 +340,18 @@ def create_training_config(args) -> Dict:
             raise
 
         # Aplicar overrides dos argumentos
-        overrides = {}
-
-        # Parâmetros básicos
-        for key in ['model', 'epochs', 'batch', 'imgsz', 'device', 'workers']:
-            value = getattr(args, key, None)
-            if value is not None:
-                overrides[key] = value
+        overrides = collect_overrides(args)
 
-        # Learning rate
-        for key in ['lr0', 'lrf', 'momentum', 'weight_decay']:
-            value = getattr(args, key, None)
-            if value is not None:
-                overrides[key] = value
-
-        # Training settings
-        for key in ['patience', 'save_period', 'cache']:
-            value = getattr(args, key, None)
-            if value is not None:
-                overrides[key] = value
-
-        # Paths
-        for key in ['project', 'name']:
-            value = getattr(args, key, None)
-            if value is not None:
-                overrides[key] = value
+        if args.cache:
+            overrides['cache'] = resolve_cache_mode(
+                args.cache, Path(args.data_path))
 
         # Sempre definir data se fornecida
         if args.data:
             overrides['data'] = args.data
 
         # Merge configurações
-        final_config = {**base_config, **overrides}
+        final_config = base_config | overrides
 
         # Criar configuração
         training_config = TrainingConfig(**final_config)
@@ -254,6 +361,8 @@ def create_training_config(args) -> Dict:
 
     else:
         # Fallback para configuração manual
+        from src.yolo import TrainingConfig, YOLOConfig
+
         logger.info("⚙️ Criando configuração manual")
 
         # Usar valores padrão ou fornecidos
@@ -281,49 +390,60 @@ def create_training_config(args) -> Dict:
 
 
 def log_training_config(training_config: Dict):
-    """Log configuração de treinamento."""
-
-    logger.info("📋 CONFIGURAÇÃO DE TREINAMENTO:")
-    logger.info("=" * 50)
-    logger.info(f"  🤖 Modelo: {training_config.get('model', 'N/A')}")
-    logger.info(f"  📊 Tarefa: {training_config.get('task', 'N/A')}")
-    logger.info(f"  📂 Data: {training_config.get('data', 'N/A')}")
-    logger.info(f"  🔄 Épocas: {training_config.get('epochs', 'N/A')}")
-    logger.info(f"  📦 Batch: {training_config.get('batch', 'N/A')}")
-    logger.info(f"  📐 Imagem: {training_config.get('imgsz', 'N/A')}px")
-    logger.info(f"  💻 Dispositivo: {training_config.get('device', 'N/A')}")
-    logger.info(f"  👥 Workers: {training_config.get('workers', 'N/A')}")
-    logger.info(f"  💾 Cache: {'✅' if training_config.get('cache') else '❌'}")
+    """Log configuração de treinamento (emitido como um único bloco)."""
+    tc = training_config
+    cache = tc.get('cache')
 
     # Verificar se augmentations estão ativas (verificando se algum parâmetro > 0)
-    aug_params = ['hsv_h', 'hsv_s', 'hsv_v', 'degrees', 'translate', 'scale',
-                  'mosaic', 'mixup', 'fliplr']
-    aug_active = any(training_config.get(param, 0) > 0 for param in aug_params)
-    logger.info(f"  🎨 Augmentation: {'✅' if aug_active else '❌'}")
-
-    logger.info(f"\n🧠 LEARNING RATE:")
-    logger.info(f"  • Inicial: {training_config.get('lr0', 'N/A')}")
-    logger.info(f"  • Final: {training_config.get('lrf', 'N/A')}")
-    logger.info(f"  • Momentum: {training_config.get('momentum', 'N/A')}")
-    logger.info(
-        f"  • Weight Decay: {training_config.get('weight_decay', 'N/A')}")
-
-    logger.info(f"\n⚡ TREINAMENTO:")
-    logger.info(f"  • Patience: {training_config.get('patience', 'N/A')}")
-    logger.info(
-        f"  • Save Period: {training_config.get('save_period', 'N/A')}")
-    logger.info(f"  • Otimizador: {training_config.get('optimizer', 'SGD')}")
-    logger.info(
-        f"  • Projeto: {training_config.get('project', 'experiments')}")
-    logger.info(f"  • Nome: {training_config.get('name', 'N/A')}")
+    aug_active = any(tc.get(param, 0) > 0 for param in _AUG_CHECK_PARAMS)
+
+    lines = [
+        "📋 CONFIGURAÇÃO DE TREINAMENTO:",
+        "=" * 50,
+        f"  🤖 Modelo: {tc.get('model', 'N/A')}",
+        f"  📊 Tarefa: {tc.get('task', 'N/A')}",
+        f"  📂 Data: {tc.get('data', 'N/A')}",
+        f"  🔄 Épocas: {tc.get('epochs', 'N/A')}",
+        f"  📦 Batch: {tc.get('batch', 'N/A')}",
+        f"  📐 Imagem: {tc.get('imgsz', 'N/A')}px",
+        f"  💻 Dispositivo: {tc.get('device', 'N/A')}",
+        f"  👥 Workers: {tc.get('workers', 'N/A')}",
+        f"  💾 Cache: {f'✅ ({cache})' if cache else '❌'}",
+        f"  🎨 Augmentation: {'✅' if aug_active else '❌'}",
+        "",
+        "🧠 LEARNING RATE:",
+        f"  • Inicial: {tc.get('lr0', 'N/A')}",
+        f"  • Final: {tc.get('lrf', 'N/A')}",
+        f"  • Momentum: {tc.get('momentum', 'N/A')}",
+        f"  • Weight Decay: {tc.get('weight_decay', 'N/A')}",
+        "",
+        "⚡ TREINAMENTO:",
+        f"  • Patience: {tc.get('patience', 'N/A')}",
+        f"  • Save Period: {tc.get('save_period', 'N/A')}",
+        f"  • Otimizador: {tc.get('optimizer', 'SGD')}",
+        f"  • Projeto: {tc.get('project', 'experiments')}",
+        f"  • Nome: {tc.get('name', 'N/A')}",
+    ]
+    logger.info("\n".join(lines))
 
 
 def main():
     """Função principal."""
-    import yaml
+    args = parse_arguments()
+
+    if args.pin_cpu:
+        # Processo principal + workers (padrão do Ultralytics: 8)
+        pin_cpu_affinity((args.workers or 8) + 1)
+
+    import torch
     from ultralytics import YOLO
 
-    args = parse_arguments()
+    # Autotune de convoluções (imgsz fixo) e TF32 em GPUs Ampere+
+    if torch.cuda.is_available():
+        torch.backends.cudnn.benchmark = True
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        torch.set_float32_matmul_precision('high')
 
     logger.info("🚀 TREINAMENTO YOLO DATALID 3.0")
     logger.info("=" * 60)
@@ -346,10 +466,13 @@ def main():
         training_config = create_training_config(args)
 
         # Garantir que o path do data.yaml está correto
-        if 'data' not in training_config or not Path(training_config['data']).exists():
-            data_yaml = data_path / "data.yaml"
-            if data_yaml.exists():
-                training_config['data'] = str(data_yaml)
+        # (o data.yaml resolvido já foi verificado; evita novo stat)
+        data_yaml = _resolve_data_yaml(str(data_path))
+        current_data = training_config.get('data')
+        if not current_data or (current_data != data_yaml
+                                and not Path(current_data).exists()):
+            if data_yaml:
+                training_config['data'] = data_yaml
                 logger.info(f"📂 Usando data.yaml: {data_yaml}")
             else:
                 logger.error(f"❌ data.yaml não encontrado em {data_path}")
@@ -368,6 +491,12 @@ def main():
         logger.info(f"📥 Carregando modelo: {model_path}")
         model = YOLO(model_path)
 
+        # Pré-carregar imagens em paralelo antes do cache em RAM do Ultralytics
+        # (no modo 'disk' o dataset não cabe na RAM: o aquecimento se auto-expulsaria)
+        cache_mode = training_config.get('cache')
+        if (cache_mode is True or cache_mode == 'ram') and args.precache_workers > 0:
+            warm_page_cache(data_path, args.precache_workers)
+
         # Preparar argumentos de treinamento
         train_args = {k: v for k, v in training_config.items() if k != 'task'}
 
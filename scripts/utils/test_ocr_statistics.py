@@ -5,125 +5,162 @@ Testa a geração de estatísticas e visualizações com dados mock.
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
-# Adicionar src ao path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+from loguru import logger
 
-from src.ocr.visualization import OCRVisualizer
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+try:
+    from numba import njit
+except ImportError:
+    # Sem numba o kernel roda como Python puro (mesmo resultado, mais lento)
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def _inject_errors(buf, length, errors, seed):
+    """
+    Injeta erros (substituição, deleção, inserção) em um buffer ASCII.
+
+    O buffer deve ter espaço para `length + errors` caracteres.
+    Retorna o novo comprimento do texto.
+    """
+    np.random.seed(seed)
+    for _ in range(errors):
+        if length == 0:
+            break
+        pos = np.random.randint(0, length)
+        # Substituir, deletar ou inserir
+        action = np.random.randint(0, 3)
+        if action == 0:
+            buf[pos] = 88 + np.random.randint(0, 3)  # 'X', 'Y' ou 'Z'
+        elif action == 1 and length > 1:
+            for j in range(pos, length - 1):
+                buf[j] = buf[j + 1]
+            length -= 1
+        else:
+            for j in range(length, pos, -1):
+                buf[j] = buf[j - 1]
+            buf[pos] = 88  # 'X'
+            length += 1
+    return length
 
 
 def generate_mock_results(n_samples=50):
-    """Gera resultados mock para teste."""
-    import numpy as np
-    
-    results = []
+    """Gera resultados mock para teste (um dict por amostra, sob demanda)."""
+    rng = np.random.default_rng()
     
     # Simular diferentes níveis de qualidade
+    # 70% perfect, 20% low error, 8% medium, 2% high
+    bins = np.digitize(rng.random(n_samples), [0.7, 0.9, 0.98])
+    
+    # Faixas (min, max) por nível: perfect, low, medium, high
+    cer_ranges = np.array([[0.0, 0.0], [0.01, 0.2], [0.2, 0.5], [0.5, 1.0]])
+    similarity_ranges = np.array([[1.0, 1.0], [0.8, 0.95], [0.5, 0.8], [0.2, 0.5]])
+    confidence_ranges = np.array([[0.85, 1.0], [0.7, 0.9], [0.5, 0.8], [0.3, 0.6]])
+    
+    def draw(ranges):
+        low, high = ranges[bins, 0], ranges[bins, 1]
+        return low + (high - low) * rng.random(n_samples)
+    
+    cer = draw(cer_ranges)
+    similarity = draw(similarity_ranges)
+    confidence = draw(confidence_ranges)
+    processing_time = rng.uniform(0.05, 0.3, size=n_samples)
+    
+    exact_match = bins == 0
+    partial_match = (bins <= 1) | ((bins == 2) & (rng.random(n_samples) < 0.5))
+    
+    # Texto de exemplo
+    text_lengths = rng.integers(5, 50, size=n_samples)
+    seeds = rng.integers(0, 2**31 - 1, size=n_samples)
+    
     for i in range(n_samples):
-        # 70% perfect, 20% low error, 8% medium, 2% high
-        rand = np.random.random()
-        
-        if rand < 0.7:  # Perfect
-            cer = 0.0
-            exact_match = True
-            partial_match = True
-            similarity = 1.0
-            confidence = np.random.uniform(0.85, 1.0)
-        elif rand < 0.9:  # Low error
-            cer = np.random.uniform(0.01, 0.2)
-            exact_match = False
-            partial_match = True
-            similarity = np.random.uniform(0.8, 0.95)
-            confidence = np.random.uniform(0.7, 0.9)
-        elif rand < 0.98:  # Medium error
-            cer = np.random.uniform(0.2, 0.5)
-            exact_match = False
-            partial_match = np.random.choice([True, False])
-            similarity = np.random.uniform(0.5, 0.8)
-            confidence = np.random.uniform(0.5, 0.8)
-        else:  # High error
-            cer = np.random.uniform(0.5, 1.0)
-            exact_match = False
-            partial_match = False
-            similarity = np.random.uniform(0.2, 0.5)
-            confidence = np.random.uniform(0.3, 0.6)
-        
-        # Texto de exemplo
-        text_length = np.random.randint(5, 50)
+        text_length = int(text_lengths[i])
         gt_text = f"Sample text {i} " * (text_length // 15 + 1)
         gt_text = gt_text[:text_length]
+        text_length = len(gt_text)  # pode ser menor que o sorteado
         
-        # Simular predição com erro
-        if cer == 0:
+        # Simular predição com erro (proporcional ao texto gerado)
+        errors = int(len(gt_text) * cer[i])
+        if errors == 0:
             pred_text = gt_text
         else:
-            # Adicionar erros simulados
-            errors = int(len(gt_text) * cer)
-            pred_text = gt_text
-            for _ in range(errors):
-                if len(pred_text) > 0:
-                    pos = np.random.randint(0, len(pred_text))
-                    # Substituir, deletar ou inserir
-                    action = np.random.choice(['sub', 'del', 'ins'])
-                    if action == 'sub':
-                        pred_text = pred_text[:pos] + np.random.choice(['X', 'Y', 'Z']) + pred_text[pos+1:]
-                    elif action == 'del' and len(pred_text) > 1:
-                        pred_text = pred_text[:pos] + pred_text[pos+1:]
-                    else:
-                        pred_text = pred_text[:pos] + 'X' + pred_text[pos:]
+            buf = np.zeros(text_length + errors, dtype=np.uint8)
+            buf[:text_length] = np.frombuffer(gt_text.encode('ascii'), dtype=np.uint8)
+            new_length = _inject_errors(buf, text_length, errors, int(seeds[i]))
+            pred_text = bytes(buf[:new_length]).decode('ascii')
         
         result = {
             'image_file': f'test_image_{i:03d}.jpg',
             'engine': 'test_engine',
             'ground_truth': gt_text,
             'predicted_text': pred_text,
-            'exact_match': exact_match,
-            'partial_match': partial_match,
-            'character_error_rate': cer,
-            'similarity': similarity,
-            'confidence': confidence,
-            'processing_time': np.random.uniform(0.05, 0.3)
+            'exact_match': bool(exact_match[i]),
+            'partial_match': bool(partial_match[i]),
+            'character_error_rate': float(cer[i]),
+            'similarity': float(similarity[i]),
+            'confidence': float(confidence[i]),
+            'processing_time': float(processing_time[i])
         }
         
-        results.append(result)
-    
-    return results
+        yield result
 
 
 def test_visualization():
     """Testa o sistema de visualização."""
-    print("🧪 Testando Sistema de Estatísticas OCR")
-    print("=" * 70)
+    # Import sob demanda (matplotlib/seaborn); requer `pip install -e .`
+    from src.ocr.visualization import OCRVisualizer
     
-    # Gerar dados mock
-    print("\n📊 Gerando dados mock...")
-    results = generate_mock_results(50)
-    print(f"✅ {len(results)} amostras geradas")
+    logger.info("🧪 Testando Sistema de Estatísticas OCR")
+    logger.info("=" * 70)
     
     # Criar diretório de saída
     output_dir = Path('outputs/test_statistics')
     output_dir.mkdir(parents=True, exist_ok=True)
-    print(f"📁 Diretório de saída: {output_dir}")
+    logger.info(f"📁 Diretório de saída: {output_dir}")
+    
+    # Gerar dados mock (gravados em JSONL à medida que são gerados)
+    logger.info("\n📊 Gerando dados mock...")
+    results = []
+    with open(output_dir / 'mock_results.jsonl', 'wb') as f:
+        for result in generate_mock_results(50):
+            f.write(_dumps(result))
+            f.write(b'\n')
+            results.append(result)
+    logger.info(f"✅ {len(results)} amostras geradas")
     
     # Criar visualizador
-    print("\n🎨 Inicializando visualizador...")
+    logger.info("\n🎨 Inicializando visualizador...")
     visualizer = OCRVisualizer(results, str(output_dir))
-    print("✅ Visualizador criado")
+    logger.info("✅ Visualizador criado")
     
     # Gerar todas as análises
-    print("\n📊 Gerando análises e visualizações...")
-    print("-" * 70)
+    logger.info("\n📊 Gerando análises e visualizações...")
+    logger.info("-" * 70)
     
     try:
         stats = visualizer.generate_all(save_plots=True)
         
-        print("\n✅ Análise completa gerada com sucesso!")
-        print("=" * 70)
+        logger.info("\n✅ Análise completa gerada com sucesso!")
+        logger.info("=" * 70)
         
         # Verificar arquivos gerados
-        print("\n📁 Arquivos gerados:")
+        logger.info("\n📁 Arquivos gerados:")
         
         expected_files = [
             'report.html',
@@ -139,68 +176,76 @@ def test_visualization():
             'error_examples.png'
         ]
         
+        # Uma única varredura do diretório em vez de exists()/stat() por arquivo
+        with os.scandir(output_dir) as entries:
+            sizes = {entry.name: entry.stat().st_size for entry in entries}
+        
         for filename in expected_files:
-            filepath = output_dir / filename
-            if filepath.exists():
-                size = filepath.stat().st_size / 1024  # KB
-                print(f"  ✅ {filename:<30} ({size:.1f} KB)")
+            size = sizes.get(filename)
+            if size is not None:
+                logger.info(f"  ✅ {filename:<30} ({size / 1024:.1f} KB)")
             else:
-                print(f"  ❌ {filename:<30} (não encontrado)")
+                logger.info(f"  ❌ {filename:<30} (não encontrado)")
         
         # Mostrar resumo das estatísticas
-        print("\n📈 Resumo das Estatísticas:")
-        print("-" * 70)
+        logger.info("\n📈 Resumo das Estatísticas:")
+        logger.info("-" * 70)
         
         if 'basic' in stats:
             basic = stats['basic']
-            print(f"  📊 Total de amostras: {basic.get('total_samples', 0)}")
-            print(f"  ✅ Exact Match Rate: {basic.get('exact_match_rate', 0):.2%}")
-            print(f"  📉 CER Médio: {basic.get('avg_cer', 0):.4f}")
-            print(f"  📈 Confiança Média: {basic.get('avg_confidence', 0):.2%}")
-            print(f"  ⏱️  Tempo Médio: {basic.get('avg_processing_time', 0):.3f}s")
+            logger.info(f"  📊 Total de amostras: {basic.get('total_samples', 0)}")
+            logger.info(f"  ✅ Exact Match Rate: {basic.get('exact_match_rate', 0):.2%}")
+            logger.info(f"  📉 CER Médio: {basic.get('avg_cer', 0):.4f}")
+            logger.info(f"  📈 Confiança Média: {basic.get('avg_confidence', 0):.2%}")
+            logger.info(f"  ⏱️  Tempo Médio: {basic.get('avg_processing_time', 0):.3f}s")
         
         if 'errors' in stats:
-            print("\n🎯 Distribuição de Erros:")
+            logger.info("\n🎯 Distribuição de Erros:")
             for category in ['perfect', 'low_error', 'medium_error', 'high_error']:
                 if category in stats['errors']:
                     cat_data = stats['errors'][category]
                     emoji = {'perfect': '🟢', 'low_error': '🔵', 'medium_error': '🟡', 'high_error': '🔴'}
-                    print(f"  {emoji.get(category, '⚪')} {category.replace('_', ' ').title()}: "
-                          f"{cat_data.get('count', 0)} ({cat_data.get('percentage', 0):.1f}%)")
+                    logger.info(f"  {emoji.get(category, '⚪')} {category.replace('_', ' ').title()}: "
+                                f"{cat_data.get('count', 0)} ({cat_data.get('percentage', 0):.1f}%)")
         
         if 'word_level' in stats:
             word = stats['word_level']
-            print(f"\n📝 Análise de Palavras:")
-            print(f"  ✅ Acurácia de Palavras: {word.get('word_accuracy', 0):.2%}")
-            print(f"  📊 Total de Palavras: {word.get('total_words_gt', 0)}")
+            logger.info(f"\n📝 Análise de Palavras:")
+            logger.info(f"  ✅ Acurácia de Palavras: {word.get('word_accuracy', 0):.2%}")
+            logger.info(f"  📊 Total de Palavras: {word.get('total_words_gt', 0)}")
         
         if 'character_confusion' in stats:
             conf = stats['character_confusion']
-            print(f"\n🔤 Confusão de Caracteres:")
-            print(f"  📊 Total de Substituições: {conf.get('total_substitutions', 0)}")
-            print(f"  🔢 Pares Únicos: {conf.get('unique_confusion_pairs', 0)}")
+            logger.info(f"\n🔤 Confusão de Caracteres:")
+            logger.info(f"  📊 Total de Substituições: {conf.get('total_substitutions', 0)}")
+            logger.info(f"  🔢 Pares Únicos: {conf.get('unique_confusion_pairs', 0)}")
             
             if 'top_confusions' in conf and conf['top_confusions']:
-                print(f"  🔥 Top 5 Confusões:")
+                logger.info(f"  🔥 Top 5 Confusões:")
                 for i, (pair, count) in enumerate(conf['top_confusions'][:5], 1):
-                    print(f"     {i}. {pair}: {count}x")
+                    logger.info(f"     {i}. {pair}: {count}x")
         
-        print("\n" + "=" * 70)
-        print("✅ TESTE CONCLUÍDO COM SUCESSO!")
-        print("=" * 70)
-        print(f"\n💡 Abra o relatório HTML: {output_dir}/report.html")
-        print(f"💡 Ver visualizações: {output_dir}/*.png")
+        logger.info("\n" + "=" * 70)
+        logger.info("✅ TESTE CONCLUÍDO COM SUCESSO!")
+        logger.info("=" * 70)
+        logger.info(f"\n💡 Abra o relatório HTML: {output_dir}/report.html")
+        logger.info(f"💡 Ver visualizações: {output_dir}/*.png")
         
         return True
         
     except Exception as e:
-        print(f"\n❌ ERRO durante o teste:")
-        print(f"   {type(e).__name__}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"\n❌ ERRO durante o teste:")
+        logger.exception(f"   {type(e).__name__}: {e}")
         return False
 
 
 if __name__ == "__main__":
+    # Saída do console em thread de background (enqueue=True): o processo
+    # principal não bloqueia em stdout enquanto gera os gráficos
+    logger.remove()
+    logger.add(sys.stdout, format="<level>{message}</level>", level="INFO",
+               enqueue=True)
+    
     success = test_visualization()
+    logger.remove()  # Drena a fila antes de sair
     sys.exit(0 if success else 1)
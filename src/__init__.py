@@ -6,11 +6,24 @@ Sistema completo para detecção e processamento de datas de validade em produto
 __version__ = "3.0.0"
 __author__ = "Datalid Team"
 
-# Importações principais
-from . import core
-from . import data
-from . import yolo
-from . import utils
+import importlib
+
+# Submódulos carregados sob demanda (PEP 562), evitando importar
+# torch/ultralytics ao usar apenas `src.core` ou scripts de CLI
+_LAZY_SUBMODULES = {'core', 'data', 'yolo', 'utils'}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
+
 
 __all__ = [
     'core',
@@ -1,90 +1,129 @@
 """
 🏗️ Módulo Core
 Funcionalidades centrais do sistema.
+
+Os símbolos são carregados sob demanda (PEP 562): `from src.core import
+ModelError` importa apenas o submódulo que define o nome. `config` é a
+exceção, pois o nome coincide com o submódulo `src.core.config`.
 """
 
+import importlib
+
 from .config import config, Config
-from .config_manager import ConfigManager, get_config, load_config
-from .config_loader import ConfigLoader, get_config_loader, load_training_config
-from .constants import *
-from .exceptions import (
+
+# Nome público -> submódulo que o define
+_LAZY_ATTRS = {
+    # Config
+    'ConfigManager': '.config_manager',
+    'get_config': '.config_manager',
+    'load_config': '.config_manager',
+    'ConfigLoader': '.config_loader',
+    'get_config_loader': '.config_loader',
+    'load_training_config': '.config_loader',
+}
+
+_LAZY_ATTRS.update(dict.fromkeys((
     # Base
-    DatalidBaseException,
-    
+    'DatalidBaseException',
+
     # Configuração
-    ConfigurationError,
-    InvalidSplitError,
-    
+    'ConfigurationError',
+    'InvalidSplitError',
+
     # Dados
-    DataError,
-    DatasetNotFoundError,
-    DatasetEmptyError,
-    InvalidDatasetFormatError,
-    ImageNotFoundError,
-    LabelNotFoundError,
-    InvalidImageFormatError,
-    InvalidLabelFormatError,
-    CorruptedImageError,
-    DataValidationError,
-    
+    'DataError',
+    'DatasetNotFoundError',
+    'DatasetEmptyError',
+    'InvalidDatasetFormatError',
+    'ImageNotFoundError',
+    'LabelNotFoundError',
+    'InvalidImageFormatError',
+    'InvalidLabelFormatError',
+    'CorruptedImageError',
+    'DataValidationError',
+
     # Modelo
-    ModelError,
-    ModelNotFoundError,
-    ModelNotLoadedError,
-    ModelLoadError,
-    InvalidModelError,
-    TrainingError,
-    PredictionError,
-    ModelExportError,
-    
+    'ModelError',
+    'ModelNotFoundError',
+    'ModelNotLoadedError',
+    'ModelLoadError',
+    'InvalidModelError',
+    'TrainingError',
+    'PredictionError',
+    'ModelExportError',
+
     # Hardware
-    HardwareError,
-    GPUNotAvailableError,
-    InsufficientMemoryError,
-    CUDAError,
-    
+    'HardwareError',
+    'GPUNotAvailableError',
+    'InsufficientMemoryError',
+    'CUDAError',
+
     # OCR
-    OCRError,
-    OCREngineNotFoundError,
-    OCRProcessingError,
-    DateParsingError,
-    InvalidDateFormatError,
-    
+    'OCRError',
+    'OCREngineNotFoundError',
+    'OCRProcessingError',
+    'DateParsingError',
+    'InvalidDateFormatError',
+
     # API
-    APIError,
-    InvalidRequestError,
-    FileTooLargeError,
-    UnsupportedFileTypeError,
-    RateLimitExceededError,
-    AuthenticationError,
-    
+    'APIError',
+    'InvalidRequestError',
+    'FileTooLargeError',
+    'UnsupportedFileTypeError',
+    'RateLimitExceededError',
+    'AuthenticationError',
+
     # Processamento
-    ProcessingError,
-    ConversionError,
-    ValidationError,
-    TimeoutError,
-    ConcurrencyError,
-    
+    'ProcessingError',
+    'ConversionError',
+    'ValidationError',
+    'TimeoutError',
+    'ConcurrencyError',
+
     # I/O
-    IOError,
-    FileReadError,
-    FileWriteError,
-    DirectoryNotFoundError,
-    PermissionDeniedError,
-    
+    'IOError',
+    'FileReadError',
+    'FileWriteError',
+    'DirectoryNotFoundError',
+    'PermissionDeniedError',
+
     # Factory functions
-    model_not_found,
-    dataset_empty,
-    gpu_not_available,
-    insufficient_memory,
-    invalid_image_format,
-    invalid_split,
-    file_too_large,
-    
+    'model_not_found',
+    'dataset_empty',
+    'gpu_not_available',
+    'insufficient_memory',
+    'invalid_image_format',
+    'invalid_split',
+    'file_too_large',
+
     # Utilities
-    handle_exceptions,
-    safe_execute
-)
+    'handle_exceptions',
+    'safe_execute',
+), '.exceptions'))
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    elif name.isupper():
+        # Constantes (antes importadas com `from .constants import *`)
+        constants = importlib.import_module('.constants', __name__)
+        try:
+            value = getattr(constants, name)
+        except AttributeError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Config
@@ -3,14 +3,210 @@
 Carrega e mescla configurações de múltiplos arquivos YAML.
 """
 
+import copy
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from functools import cache, lru_cache
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Union
 from loguru import logger
 
+# Loader em C (libyaml) quando disponível
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Cache LRU de YAMLs já parseados: caminho -> ((mtime_ns, tamanho), dados)
+_YAML_CACHE_MAXSIZE = 100
+_yaml_cache: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+
+# Sidecar JSON opcional (DATALID_YAML_JSON_CACHE=1): o parser JSON em C é
+# bem mais rápido que o YAML para o mesmo conteúdo
+_JSON_SIDECAR_ENV = 'DATALID_YAML_JSON_CACHE'
+_JSON_SIDECAR_SUFFIX = '.cache.json'
+
+
+def _intern_keys(obj: Any) -> Any:
+    """
+    Interna (sys.intern) recursivamente as chaves string de dicts, para que
+    buscas com chaves também internadas (ver `_split_key`) comparem por
+    identidade.
+    """
+    if isinstance(obj, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: _intern_keys(v)
+                for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_keys(v) for v in obj]
+    return obj
+
+
+def _read_yaml(path: Path, mtime_ns: int) -> Any:
+    """
+    Lê e parseia um YAML, usando/gerando o sidecar JSON se habilitado.
+    
+    O sidecar começa com uma linha contendo o mtime_ns do YAML de origem e
+    só é usado se esse valor bater com o arquivo atual.
+    """
+    use_sidecar = os.environ.get(_JSON_SIDECAR_ENV) == '1'
+    sidecar = Path(str(path) + _JSON_SIDECAR_SUFFIX)
+    
+    if use_sidecar:
+        try:
+            header, _, payload = sidecar.read_bytes().partition(b'\n')
+            if int(header) == mtime_ns:
+                return _intern_keys(json.loads(payload))
+        except (OSError, ValueError):
+            pass
+    
+    if _YAML_LOADER is not yaml.SafeLoader:
+        # libyaml decodifica UTF-8/UTF-16 (com BOM) em C a partir dos bytes
+        with open(path, 'rb') as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+    
+    data = _intern_keys(data)
+    
+    if use_sidecar:
+        _write_json_sidecar(sidecar, data, mtime_ns)
+    
+    return data
+
+
+def _write_json_sidecar(sidecar: Path, data: Any, mtime_ns: int) -> None:
+    """Grava o sidecar JSON de forma atômica (falhas são ignoradas)."""
+    try:
+        payload = json.dumps(data, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return
+    
+    # Chaves não-string, datas etc. não sobrevivem ao JSON: não gravar
+    if json.loads(payload) != data:
+        return
+    
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(f"{mtime_ns}\n")
+            f.write(payload)
+        os.replace(tmp_path, sidecar)
+    except OSError as e:
+        logger.debug("Sidecar JSON não gravado ({}): {}", sidecar, e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_yaml_cached(path: Union[str, Path], shared: bool = False) -> Any:
+    """
+    Carrega um arquivo YAML reaproveitando o parse anterior se o arquivo
+    não mudou (mesmo mtime e tamanho).
+    
+    Args:
+        path: Caminho do arquivo YAML
+        shared: Se True, retorna o objeto do cache sem copiar. É o que
+               permite ConfigLoader e ConfigManager compartilharem um único
+               parse do config.yaml; o resultado NÃO deve ser modificado.
+        
+    Returns:
+        Dados do YAML (cópia profunda, a menos que `shared=True`)
+    """
+    key = str(path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    
+    with _yaml_cache_lock:
+        entry = _yaml_cache.get(key)
+        if entry is not None and entry[0] == signature:
+            _yaml_cache.move_to_end(key)
+            return entry[1] if shared else copy.deepcopy(entry[1])
+    
+    data = _read_yaml(Path(path), stat.st_mtime_ns)
+    
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (signature, data)
+        _yaml_cache.move_to_end(key)
+        if len(_yaml_cache) > _YAML_CACHE_MAXSIZE:
+            _yaml_cache.popitem(last=False)
+    
+    return data if shared else copy.deepcopy(data)
+
+
+def invalidate_yaml_cache(path: Optional[Union[str, Path]] = None) -> None:
+    """
+    Descarta YAMLs do cache (um arquivo específico ou todos).
+    
+    Args:
+        path: Arquivo a descartar. Se None, limpa todo o cache
+    """
+    with _yaml_cache_lock:
+        if path is None:
+            _yaml_cache.clear()
+        else:
+            _yaml_cache.pop(str(path), None)
+
+
+@lru_cache(maxsize=1)
+def _find_project_root() -> Optional[Path]:
+    """
+    Encontra (uma única vez por processo) a raiz do projeto: o primeiro
+    diretório acima deste módulo que contém config/config.yaml.
+    
+    Returns:
+        Path da raiz, ou None se não encontrada
+    """
+    current = Path(__file__).resolve().parent
+    while True:
+        if os.path.exists(os.path.join(current, 'config', 'config.yaml')):
+            return current
+        if current.parent == current:
+            return None
+        current = current.parent
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Divide uma chave 'a.b.c' em partes internadas (memoizado)."""
+    return tuple(sys.intern(part) for part in key.split('.'))
+
+
+def _deep_merge_into(dst: Dict, src: Dict, owned: set) -> None:
+    """
+    Mescla `src` em `dst` (in-place) de forma iterativa, sem recursão.
+    
+    Sub-dicionários compartilhados com as entradas são copiados (raso) apenas
+    quando precisam ser alterados; `owned` guarda os ids dos dicts já
+    pertencentes ao resultado.
+    """
+    stack = [(dst, src)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                if id(current) not in owned:
+                    current = dict(current)
+                    target[key] = current
+                    owned.add(id(current))
+                stack.append((current, value))
+            else:
+                target[key] = value
+
 
 class ConfigLoader:
-    """Carregador de configurações a partir de arquivos YAML."""
+    """
+    Carregador de configurações a partir de arquivos YAML.
+
+    O config.yaml é parseado uma única vez por processo (parse compartilhado
+    com ConfigManager); cada instância guarda sua própria cópia em `configs`,
+    e os getters devolvem referências a ela.
+    """
     
     def __init__(self, config_dir: Optional[Path] = None):
         """
@@ -20,11 +216,19 @@ class ConfigLoader:
             config_dir: Diretório de configurações. Se None, usa config/
         """
         if config_dir is None:
-            root_dir = Path(__file__).resolve().parent.parent.parent
+            root_dir = _find_project_root() or Path(__file__).resolve().parent.parent.parent
             config_dir = root_dir / "config"
         
         self.config_dir = Path(config_dir)
         self.configs = {}
+        self._main_source = None  # parse compartilhado que originou configs['main']
+        
+        # Diretórios de configuração por tarefa (montados uma única vez)
+        yolo_dir = os.path.join(self.config_dir, 'yolo')
+        self._task_dirs = {
+            'segment': os.path.join(yolo_dir, 'segmentation'),
+            'detect': os.path.join(yolo_dir, 'bbox'),
+        }
         
         # Carregar configuração principal
         self._load_main_config()
@@ -37,10 +241,34 @@ class ConfigLoader:
             logger.warning(f"⚠️ Configuração principal não encontrada: {main_config_path}")
             return
         
-        with open(main_config_path, 'r', encoding='utf-8') as f:
-            self.configs['main'] = yaml.safe_load(f)
+        # Parse compartilhado com ConfigManager; a instância recebe uma cópia
+        self._main_source = _load_yaml_cached(main_config_path, shared=True)
+        self.configs['main'] = copy.deepcopy(self._main_source)
+        
+        logger.info("✅ Configuração principal carregada: {}", main_config_path)
+    
+    def _refresh_main(self) -> Optional[Dict[str, Any]]:
+        """
+        Relê o config.yaml via cache de YAML (só um stat se não mudou) e
+        devolve a configuração principal vigente.
         
-        logger.info(f"✅ Configuração principal carregada: {main_config_path}")
+        Se o arquivo foi editado, `configs['main']` é substituído por uma
+        cópia do novo conteúdo.
+        """
+        if self._main_source is not None:
+            try:
+                parsed = _load_yaml_cached(self.config_dir / "config.yaml", shared=True)
+            except OSError:
+                parsed = self._main_source  # arquivo removido: mantém o último parse
+            if parsed is not self._main_source:
+                self._main_source = parsed
+                self.configs['main'] = copy.deepcopy(parsed)
+        return self.configs.get('main')
+    
+    def _model_config_path(self, model_name: str, task: str = 'segment') -> str:
+        """Caminho (str) do YAML de configuração de um modelo."""
+        task_dir = self._task_dirs['segment' if task == 'segment' else 'detect']
+        return os.path.join(task_dir, model_name + '.yaml')
     
     def load_model_config(self, model_name: str, task: str = 'segment') -> Dict[str, Any]:
         """
@@ -53,19 +281,48 @@ class ConfigLoader:
         Returns:
             Dicionário com configurações do modelo
         """
-        task_dir = 'segmentation' if task == 'segment' else 'bbox'
-        model_config_path = self.config_dir / 'yolo' / task_dir / f'{model_name}.yaml'
+        model_config_path = self._model_config_path(model_name, task)
         
-        if not model_config_path.exists():
+        if not os.path.exists(model_config_path):
             logger.warning(f"⚠️ Configuração do modelo não encontrada: {model_config_path}")
             return {}
         
-        with open(model_config_path, 'r', encoding='utf-8') as f:
-            model_config = yaml.safe_load(f)
+        model_config = _load_yaml_cached(model_config_path)
         
-        logger.info(f"✅ Configuração do modelo carregada: {model_name}")
+        logger.info("✅ Configuração do modelo carregada: {}", model_name)
         return model_config
     
+    def preload_all_model_configs(self, task: str = 'segment') -> int:
+        """
+        Carrega no cache, de uma vez, todos os YAMLs de modelo de uma tarefa.
+        
+        Útil em varreduras de variantes (yolov8n/s/m...): as leituras são
+        feitas em paralelo e os `load_model_config` seguintes saem do cache.
+        
+        Args:
+            task: Tipo de tarefa ('segment' ou 'detect')
+            
+        Returns:
+            Número de arquivos carregados
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        task_dir = self._task_dirs['segment' if task == 'segment' else 'detect']
+        try:
+            with os.scandir(task_dir) as entries:
+                yamls = [entry.path for entry in entries
+                         if entry.name.endswith('.yaml') and entry.is_file()]
+        except FileNotFoundError:
+            return 0
+        
+        if yamls:
+            with ThreadPoolExecutor(max_workers=min(8, len(yamls))) as executor:
+                # shared=True: só popula o cache, sem cópias descartáveis
+                list(executor.map(lambda path: _load_yaml_cached(path, shared=True), yamls))
+        
+        logger.debug("📦 {} configurações de modelo pré-carregadas ({})", len(yamls), task)
+        return len(yamls)
+    
     def get(self, key: str, default: Any = None) -> Any:
         """
         Obtém valor de configuração usando notação de ponto.
@@ -80,13 +337,12 @@ class ConfigLoader:
         if 'main' not in self.configs:
             return default
         
-        keys = key.split('.')
         value = self.configs['main']
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
+        for k in _split_key(key):
+            try:
                 value = value[k]
-            else:
+            except (KeyError, TypeError):
                 return default
         
         return value
@@ -146,44 +402,53 @@ class ConfigLoader:
             *configs: Dicionários de configuração para mesclar
             
         Returns:
-            Dicionário mesclado
+            Dicionário mesclado (as entradas não são modificadas)
         """
         merged = {}
+        owned = {id(merged)}
         for config in configs:
-            merged = self._deep_merge(merged, config)
+            _deep_merge_into(merged, config, owned)
         return merged
     
     def _deep_merge(self, dict1: Dict, dict2: Dict) -> Dict:
-        """Mescla recursivamente dois dicionários."""
-        result = dict1.copy()
-        
-        for key, value in dict2.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
-        
-        return result
+        """Mescla dois dicionários sem modificá-los."""
+        return self.merge_configs(dict1, dict2)
     
     def __repr__(self) -> str:
         return f"ConfigLoader(config_dir={self.config_dir})"
 
 
-# Instância global (singleton)
-_config_loader = None
-
-
+@cache
 def get_config_loader() -> ConfigLoader:
     """
     Obtém instância global do carregador de configurações.
     
+    Use `get_config_loader.cache_clear()` para descartar a instância
+    (ex.: em testes).
+    
     Returns:
         ConfigLoader singleton
     """
-    global _config_loader
-    if _config_loader is None:
-        _config_loader = ConfigLoader()
-    return _config_loader
+    return ConfigLoader()
+
+
+# Cache LRU de load_training_config:
+# assinatura -> (config.yaml usado, mtime do YAML do modelo, config)
+_TRAINING_CONFIG_CACHE_MAXSIZE = 64
+_training_config_cache: "OrderedDict[tuple, Tuple[Any, Optional[int], Dict[str, Any]]]" = OrderedDict()
+_training_config_cache_lock = threading.Lock()
+
+
+# Tarefas já pré-carregadas via DATALID_PRELOAD_MODELS
+_preloaded_tasks: set = set()
+
+
+def _mtime_ns(path: Union[str, Path]) -> Optional[int]:
+    """mtime (ns) de um arquivo, ou None se não existir."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
 
 def load_training_config(model_name: str, task: str = 'segment', 
@@ -204,38 +469,80 @@ def load_training_config(model_name: str, task: str = 'segment',
         **overrides: Sobrescritas manuais
         
     Returns:
-        Dicionário com configuração final
+        Dicionário com configuração final (cópia independente a cada chamada)
     """
     loader = get_config_loader()
     
-    # 1. Configuração base do config.yaml
+    # Chamadas repetidas com os mesmos argumentos reutilizam o resultado,
+    # desde que config.yaml e o YAML do modelo não tenham mudado
+    try:
+        cache_key = (str(loader.config_dir), model_name, task, preset,
+                     tuple(sorted(overrides.items())))
+        hash(cache_key)
+    except TypeError:
+        cache_key = (str(loader.config_dir), model_name, task, preset,
+                     repr(sorted(overrides.items())))
+    
+    # O config.yaml passa pelo cache de YAML: editado, vira um novo objeto
+    # (e o loader passa a usá-lo); comparado por identidade abaixo
+    main_config = loader._refresh_main()
+    model_mtime = _mtime_ns(loader._model_config_path(model_name, task))
+    
+    with _training_config_cache_lock:
+        cached = _training_config_cache.get(cache_key)
+        if cached is not None and cached[0] is main_config and cached[1] == model_mtime:
+            _training_config_cache.move_to_end(cache_key)
+            final_config = cached[2]
+        else:
+            final_config = None
+    
+    if final_config is not None:
+        logger.debug("📋 Configuração de treinamento em cache: {}", model_name)
+        return copy.deepcopy(final_config)
+    
+    # Pré-carregar todos os YAMLs da tarefa (opcional, para varreduras)
+    if os.environ.get('DATALID_PRELOAD_MODELS') and task not in _preloaded_tasks:
+        loader.preload_all_model_configs(task)
+        _preloaded_tasks.add(task)
+    
+    # 1. Configuração base do config.yaml (referência: merge_configs não a modifica)
     base_config = loader.get('training', {})
     
     # 2. Configuração específica do modelo
     model_config = loader.load_model_config(model_name, task)
     
+    sources = [base_config, model_config]
+    
     # 3. Preset (se fornecido)
-    preset_config = {}
     if preset:
-        preset_config = loader.get_training_preset(preset)
-    
-    # 4. Mesclar tudo
-    final_config = loader.merge_configs(
-        base_config,
-        model_config,
-        preset_config,
-        overrides
-    )
-    
-    logger.info(f"📋 Configuração de treinamento carregada:")
-    logger.info(f"  - Modelo: {model_name}")
-    logger.info(f"  - Tarefa: {task}")
+        sources.append(loader.get_training_preset(preset))
+    
+    # 4. Overrides (se fornecidos)
+    if overrides:
+        sources.append(overrides)
+    
+    # Mesclar apenas as fontes presentes (caso comum: base + modelo)
+    final_config = loader.merge_configs(*sources)
+    
+    # Mensagens com argumentos: a formatação só ocorre se INFO estiver ativo
+    logger.info("📋 Configuração de treinamento carregada:")
+    logger.info("  - Modelo: {}", model_name)
+    logger.info("  - Tarefa: {}", task)
     if preset:
-        logger.info(f"  - Preset: {preset}")
+        logger.info("  - Preset: {}", preset)
     if overrides:
-        logger.info(f"  - Overrides: {list(overrides.keys())}")
+        logger.opt(lazy=True).info("  - Overrides: {}", lambda: list(overrides.keys()))
+    
+    # O resultado mesclado referencia sub-dicts de loader.configs (modificáveis):
+    # o cache guarda uma cópia isolada e o chamador recebe outra
+    final_config = copy.deepcopy(final_config)
+    with _training_config_cache_lock:
+        _training_config_cache[cache_key] = (main_config, model_mtime, final_config)
+        _training_config_cache.move_to_end(cache_key)
+        if len(_training_config_cache) > _TRAINING_CONFIG_CACHE_MAXSIZE:
+            _training_config_cache.popitem(last=False)
     
-    return final_config
+    return copy.deepcopy(final_config)
 
 
 # Exports
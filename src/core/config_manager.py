@@ -3,15 +3,32 @@
 Carrega e gerencia todas as configurações do projeto a partir de arquivos YAML.
 """
 
+from functools import cache
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from loguru import logger
 import os
 
+from .config_loader import (
+    _find_project_root,
+    _load_yaml_cached,
+    _split_key,
+    invalidate_yaml_cache
+)
+
+# Dumper em C (libyaml) quando disponível
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 class ConfigManager:
-    """Gerenciador centralizado de configurações."""
+    """
+    Gerenciador centralizado de configurações.
+
+    O config.yaml é parseado uma única vez por processo (parse compartilhado
+    com ConfigLoader); cada instância guarda sua própria cópia em `config`, e
+    os getters devolvem referências a ela.
+    """
     
     def __init__(self, config_path: Optional[str] = None):
         """
@@ -22,27 +39,33 @@ class ConfigManager:
                         Se None, usa config/config.yaml
         """
         if config_path is None:
-            # Encontrar raiz do projeto
-            current = Path(__file__).resolve()
-            while current.parent != current:
-                if (current / 'config' / 'config.yaml').exists():
-                    config_path = current / 'config' / 'config.yaml'
-                    break
-                current = current.parent
-            
-            if config_path is None:
+            # Encontrar raiz do projeto (resultado cacheado por processo)
+            root_dir = _find_project_root()
+            if root_dir is None:
                 raise FileNotFoundError("Arquivo config/config.yaml não encontrado")
+            config_path = root_dir / 'config' / 'config.yaml'
         
         self.config_path = Path(config_path)
         self.config = self._load_config()
         self.root_dir = self.config_path.parent.parent
         
-        logger.info(f"📋 Configurações carregadas de: {self.config_path}")
+        # Diretórios de configuração por tarefa (montados uma única vez)
+        yolo_dir = os.path.join(self.root_dir, 'config', 'yolo')
+        self._task_dirs = {
+            'segment': os.path.join(yolo_dir, 'segmentation'),
+            'detect': os.path.join(yolo_dir, 'bbox'),
+        }
+        
+        logger.info("📋 Configurações carregadas de: {}", self.config_path)
     
     def _load_config(self) -> Dict[str, Any]:
-        """Carrega arquivo de configuração YAML."""
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        """
+        Carrega arquivo de configuração YAML.
+        
+        Reaproveita o parse em cache (compartilhado com ConfigLoader) e
+        devolve uma cópia própria da instância.
+        """
+        return _load_yaml_cached(self.config_path)
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -58,13 +81,12 @@ class ConfigManager:
         Example:
             config.get('data.splits.train')  # 0.7
         """
-        keys = key.split('.')
         value = self.config
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
+        for k in _split_key(key):
+            try:
                 value = value[k]
-            else:
+            except (KeyError, TypeError):
                 return default
         
         return value
@@ -88,7 +110,7 @@ class ConfigManager:
         
         if create and not abs_path.exists():
             abs_path.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"📁 Diretório criado: {abs_path}")
+            logger.debug("📁 Diretório criado: {}", abs_path)
         
         return abs_path
     
@@ -103,16 +125,15 @@ class ConfigManager:
         Returns:
             Dicionário com configurações do modelo
         """
-        task_dir = 'segmentation' if task == 'segment' else 'bbox'
-        model_config_path = self.root_dir / 'config' / 'yolo' / task_dir / f'{model_name}.yaml'
+        task_dir = self._task_dirs['segment' if task == 'segment' else 'detect']
+        model_config_path = os.path.join(task_dir, model_name + '.yaml')
         
-        if not model_config_path.exists():
+        if not os.path.exists(model_config_path):
             raise FileNotFoundError(f"Configuração do modelo não encontrada: {model_config_path}")
         
-        with open(model_config_path, 'r', encoding='utf-8') as f:
-            model_config = yaml.safe_load(f)
+        model_config = _load_yaml_cached(model_config_path)
         
-        logger.info(f"🤖 Configuração do modelo carregada: {model_name}")
+        logger.info("🤖 Configuração do modelo carregada: {}", model_name)
         return model_config
     
     def get_training_config(self, preset: Optional[str] = None) -> Dict[str, Any]:
@@ -129,7 +150,7 @@ class ConfigManager:
         if preset:
             preset_config = self.get(f'training.presets.{preset}')
             if preset_config:
-                logger.info(f"🎯 Usando preset de treinamento: {preset}")
+                logger.info("🎯 Usando preset de treinamento: {}", preset)
                 return preset_config
             else:
                 logger.warning(f"⚠️ Preset '{preset}' não encontrado, usando padrão")
@@ -187,7 +208,7 @@ class ConfigManager:
             config = config[k]
         
         config[keys[-1]] = value
-        logger.debug(f"🔧 Configuração atualizada: {key} = {value}")
+        logger.debug("🔧 Configuração atualizada: {} = {}", key, value)
     
     def save(self, path: Optional[str] = None) -> None:
         """
@@ -198,31 +219,31 @@ class ConfigManager:
         """
         save_path = Path(path) if path else self.config_path
         
-        with open(save_path, 'w', encoding='utf-8') as f:
-            yaml.dump(self.config, f, default_flow_style=False, 
-                     allow_unicode=True, indent=2)
+        # Emissor em C escrevendo direto no arquivo; sort_keys=False mantém a
+        # ordem original das chaves (e evita ordenar cada nível)
+        with save_path.open('w', encoding='utf-8', buffering=1 << 16) as f:
+            yaml.dump(self.config, f, Dumper=_YAML_DUMPER, default_flow_style=False,
+                      allow_unicode=True, indent=2, sort_keys=False)
         
-        logger.success(f"💾 Configurações salvas em: {save_path}")
+        invalidate_yaml_cache(save_path)
+        logger.success("💾 Configurações salvas em: {}", save_path)
     
     def __repr__(self) -> str:
         return f"ConfigManager(config_path={self.config_path})"
 
 
-# Instância global (singleton)
-_config_manager = None
-
-
+@cache
 def get_config() -> ConfigManager:
     """
     Obtém instância global do gerenciador de configurações.
     
+    Use `get_config.cache_clear()` para descartar a instância
+    (ex.: em testes).
+    
     Returns:
         ConfigManager singleton
     """
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager
+    return ConfigManager()
 
 
 def load_config(config_path: Optional[str] = None) -> ConfigManager:
@@ -3,17 +3,28 @@
 Define todas as exceções específicas do projeto.
 """
 
-from typing import Optional, Any, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Any, List, Tuple
 
 
 class DatalidBaseException(Exception):
     """Exceção base para todos os erros do Datalid."""
     
+    # Slots dão layout fixo a message/details (acesso por descritor); o
+    # __dict__ herdado de BaseException continua existindo. Subclasses
+    # declaram `__slots__ = ()`, e o __reduce__ abaixo preserva os slots no pickle
+    __slots__ = ('message', 'details')
+    
     def __init__(self, message: str, details: Optional[Any] = None):
         self.message = message
         self.details = details
         super().__init__(self.message)
     
+    def __reduce__(self):
+        # O __reduce__ padrão de Exception só preserva args e __dict__
+        return (self.__class__, (self.message, self.details))
+    
     def __str__(self) -> str:
         if self.details:
             return f"{self.message} | Detalhes: {self.details}"
@@ -26,12 +37,12 @@ class DatalidBaseException(Exception):
 
 class ConfigurationError(DatalidBaseException):
     """Erro de configuração."""
-    pass
+    __slots__ = ()
 
 
 class InvalidSplitError(ConfigurationError):
     """Erro na divisão train/val/test."""
-    pass
+    __slots__ = ()
 
 
 # ========================================
@@ -40,52 +51,52 @@ class InvalidSplitError(ConfigurationError):
 
 class DataError(DatalidBaseException):
     """Erro base relacionado a dados."""
-    pass
+    __slots__ = ()
 
 
 class DatasetNotFoundError(DataError):
     """Dataset não encontrado."""
-    pass
+    __slots__ = ()
 
 
 class DatasetEmptyError(DataError):
     """Dataset vazio."""
-    pass
+    __slots__ = ()
 
 
 class InvalidDatasetFormatError(DataError):
     """Formato de dataset inválido."""
-    pass
+    __slots__ = ()
 
 
 class ImageNotFoundError(DataError):
     """Imagem não encontrada."""
-    pass
+    __slots__ = ()
 
 
 class LabelNotFoundError(DataError):
     """Label não encontrado."""
-    pass
+    __slots__ = ()
 
 
 class InvalidImageFormatError(DataError):
     """Formato de imagem inválido."""
-    pass
+    __slots__ = ()
 
 
 class InvalidLabelFormatError(DataError):
     """Formato de label inválido."""
-    pass
+    __slots__ = ()
 
 
 class CorruptedImageError(DataError):
     """Imagem corrompida."""
-    pass
+    __slots__ = ()
 
 
 class DataValidationError(DataError):
     """Erro na validação dos dados."""
-    pass
+    __slots__ = ()
 
 
 # ========================================
@@ -94,42 +105,42 @@ class DataValidationError(DataError):
 
 class ModelError(DatalidBaseException):
     """Erro base relacionado a modelos."""
-    pass
+    __slots__ = ()
 
 
 class ModelNotFoundError(ModelError):
     """Modelo não encontrado."""
-    pass
+    __slots__ = ()
 
 
 class ModelNotLoadedError(ModelError):
     """Modelo não foi carregado."""
-    pass
+    __slots__ = ()
 
 
 class ModelLoadError(ModelError):
     """Erro ao carregar modelo."""
-    pass
+    __slots__ = ()
 
 
 class InvalidModelError(ModelError):
     """Modelo inválido."""
-    pass
+    __slots__ = ()
 
 
 class TrainingError(ModelError):
     """Erro durante treinamento."""
-    pass
+    __slots__ = ()
 
 
 class PredictionError(ModelError):
     """Erro durante predição."""
-    pass
+    __slots__ = ()
 
 
 class ModelExportError(ModelError):
     """Erro ao exportar modelo."""
-    pass
+    __slots__ = ()
 
 
 # ========================================
@@ -138,22 +149,22 @@ class ModelExportError(ModelError):
 
 class HardwareError(DatalidBaseException):
     """Erro base relacionado a hardware."""
-    pass
+    __slots__ = ()
 
 
 class GPUNotAvailableError(HardwareError):
     """GPU não disponível."""
-    pass
+    __slots__ = ()
 
 
 class InsufficientMemoryError(HardwareError):
     """Memória insuficiente."""
-    pass
+    __slots__ = ()
 
 
 class CUDAError(HardwareError):
     """Erro relacionado ao CUDA."""
-    pass
+    __slots__ = ()
 
 
 # ========================================
@@ -162,27 +173,27 @@ class CUDAError(HardwareError):
 
 class OCRError(DatalidBaseException):
     """Erro base relacionado a OCR."""
-    pass
+    __slots__ = ()
 
 
 class OCREngineNotFoundError(OCRError):
     """Engine de OCR não encontrado."""
-    pass
+    __slots__ = ()
 
 
 class OCRProcessingError(OCRError):
     """Erro no processamento OCR."""
-    pass
+    __slots__ = ()
 
 
 class DateParsingError(OCRError):
     """Erro ao fazer parsing de data."""
-    pass
+    __slots__ = ()
 
 
 class InvalidDateFormatError(OCRError):
     """Formato de data inválido."""
-    pass
+    __slots__ = ()
 
 
 # ========================================
@@ -191,32 +202,32 @@ class InvalidDateFormatError(OCRError):
 
 class APIError(DatalidBaseException):
     """Erro base da API."""
-    pass
+    __slots__ = ()
 
 
 class InvalidRequestError(APIError):
     """Request inválido."""
-    pass
+    __slots__ = ()
 
 
 class FileTooLargeError(APIError):
     """Arquivo muito grande."""
-    pass
+    __slots__ = ()
 
 
 class UnsupportedFileTypeError(APIError):
     """Tipo de arquivo não suportado."""
-    pass
+    __slots__ = ()
 
 
 class RateLimitExceededError(APIError):
     """Rate limit excedido."""
-    pass
+    __slots__ = ()
 
 
 class AuthenticationError(APIError):
     """Erro de autenticação."""
-    pass
+    __slots__ = ()
 
 
 # ========================================
@@ -225,27 +236,27 @@ class AuthenticationError(APIError):
 
 class ProcessingError(DatalidBaseException):
     """Erro base de processamento."""
-    pass
+    __slots__ = ()
 
 
 class ConversionError(ProcessingError):
     """Erro na conversão de dados."""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(ProcessingError):
     """Erro na validação."""
-    pass
+    __slots__ = ()
 
 
 class TimeoutError(ProcessingError):
     """Timeout no processamento."""
-    pass
+    __slots__ = ()
 
 
 class ConcurrencyError(ProcessingError):
     """Erro de concorrência."""
-    pass
+    __slots__ = ()
 
 
 # ========================================
@@ -254,38 +265,56 @@ class ConcurrencyError(ProcessingError):
 
 class IOError(DatalidBaseException):
     """Erro base de I/O."""
-    pass
+    __slots__ = ()
 
 
 class FileReadError(IOError):
     """Erro ao ler arquivo."""
-    pass
+    __slots__ = ()
 
 
 class FileWriteError(IOError):
     """Erro ao escrever arquivo."""
-    pass
+    __slots__ = ()
 
 
 class DirectoryNotFoundError(IOError):
     """Diretório não encontrado."""
-    pass
+    __slots__ = ()
 
 
 class PermissionDeniedError(IOError):
     """Permissão negada."""
-    pass
+    __slots__ = ()
 
 
 # ========================================
 # FACTORY FUNCTIONS PARA EXCEÇÕES COMUNS
 # ========================================
 
+# Partes constantes dos `details`, criadas uma única vez
+_MODEL_NOT_FOUND_HINT = MappingProxyType({"suggestion": "Verifique se o arquivo existe"})
+_DATASET_EMPTY_HINT = MappingProxyType({"suggestion": "Verifique se há imagens no diretório"})
+_GPU_NOT_AVAILABLE_DETAILS = MappingProxyType({
+    "suggestion": "Instale CUDA e drivers NVIDIA para usar GPU",
+    "install_cmd": "pip install torch torchvision --index-url https://download.pytorch.org/whl/cu118"
+})
+_INSUFFICIENT_MEMORY_HINT = MappingProxyType({"suggestion": "Reduza o batch_size ou use imagens menores"})
+_INVALID_SPLIT_HINT = MappingProxyType({"suggestion": "Ajuste os valores para que somem exatamente 1.0"})
+_FILE_TOO_LARGE_HINT = MappingProxyType({"suggestion": "Reduza o tamanho do arquivo ou comprima a imagem"})
+
+
+@lru_cache(maxsize=8)
+def _formats_suggestion(supported_formats: Tuple[str, ...]) -> str:
+    """Sugestão com a lista de formatos (as listas usadas são poucas e fixas)."""
+    return f"Use um dos formatos: {', '.join(supported_formats)}"
+
+
 def model_not_found(model_path: str) -> ModelNotFoundError:
     """Cria exceção de modelo não encontrado."""
     return ModelNotFoundError(
         f"Modelo não encontrado: {model_path}",
-        details={"path": model_path, "suggestion": "Verifique se o arquivo existe"}
+        details={"path": model_path, **_MODEL_NOT_FOUND_HINT}
     )
 
 
@@ -293,7 +322,7 @@ def dataset_empty(dataset_path: str) -> DatasetEmptyError:
     """Cria exceção de dataset vazio."""
     return DatasetEmptyError(
         f"Dataset vazio: {dataset_path}",
-        details={"path": dataset_path, "suggestion": "Verifique se há imagens no diretório"}
+        details={"path": dataset_path, **_DATASET_EMPTY_HINT}
     )
 
 
@@ -301,10 +330,7 @@ def gpu_not_available() -> GPUNotAvailableError:
     """Cria exceção de GPU não disponível."""
     return GPUNotAvailableError(
         "GPU não disponível. Usando CPU (mais lento).",
-        details={
-            "suggestion": "Instale CUDA e drivers NVIDIA para usar GPU",
-            "install_cmd": "pip install torch torchvision --index-url https://download.pytorch.org/whl/cu118"
-        }
+        details=dict(_GPU_NOT_AVAILABLE_DETAILS)
     )
 
 
@@ -315,7 +341,7 @@ def insufficient_memory(required_gb: float, available_gb: float) -> Insufficient
         details={
             "required_gb": required_gb,
             "available_gb": available_gb,
-            "suggestion": "Reduza o batch_size ou use imagens menores"
+            **_INSUFFICIENT_MEMORY_HINT
         }
     )
 
@@ -327,7 +353,7 @@ def invalid_image_format(file_path: str, supported_formats: List[str]) -> Invali
         details={
             "file_path": file_path,
             "supported_formats": supported_formats,
-            "suggestion": f"Use um dos formatos: {', '.join(supported_formats)}"
+            "suggestion": _formats_suggestion(tuple(supported_formats))
         }
     )
 
@@ -342,7 +368,7 @@ def invalid_split(train: float, val: float, test: float) -> InvalidSplitError:
             "val": val,
             "test": test,
             "total": total,
-            "suggestion": "Ajuste os valores para que somem exatamente 1.0"
+            **_INVALID_SPLIT_HINT
         }
     )
 
@@ -354,7 +380,7 @@ def file_too_large(file_size_mb: float, max_size_mb: float) -> FileTooLargeError
         details={
             "file_size_mb": file_size_mb,
             "max_size_mb": max_size_mb,
-            "suggestion": "Reduza o tamanho do arquivo ou comprima a imagem"
+            **_FILE_TOO_LARGE_HINT
         }
     )
 
@@ -383,20 +409,40 @@ def handle_exceptions(*exception_types: Type[Exception]):
             pass
     """
     def decorator(func: Callable) -> Callable:
+        # Resolvido uma vez na decoração, não a cada chamada
+        func_name = func.__name__
+        
+        if not exception_types:
+            # Sem tipos esperados: apenas o tratamento de erros inesperados
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    msg = str(e)
+                    logger.error(f"Erro inesperado em {func_name}: {msg}")
+                    raise DatalidBaseException(
+                        f"Erro inesperado em {func_name}",
+                        details={"original_error": msg, "function": func_name}
+                    )
+            return wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except exception_types as e:
-                logger.error(f"Erro em {func.__name__}: {str(e)}")
-                if hasattr(e, 'details') and e.details:
-                    logger.error(f"Detalhes: {e.details}")
+                logger.error(f"Erro em {func_name}: {e}")
+                details = getattr(e, 'details', None)
+                if details:
+                    logger.error(f"Detalhes: {details}")
                 raise
             except Exception as e:
-                logger.error(f"Erro inesperado em {func.__name__}: {str(e)}")
+                msg = str(e)
+                logger.error(f"Erro inesperado em {func_name}: {msg}")
                 raise DatalidBaseException(
-                    f"Erro inesperado em {func.__name__}",
-                    details={"original_error": str(e), "function": func.__name__}
+                    f"Erro inesperado em {func_name}",
+                    details={"original_error": msg, "function": func_name}
                 )
         return wrapper
     return decorator
@@ -23,6 +23,8 @@ from .validators import (
 
 from .transforms import (
     DataTransforms,
+    NormalizeToTensor,
+    GPUTransforms,
     ImagePreprocessor,
     MosaicAugmentation,
     resize_with_padding,
@@ -33,7 +35,11 @@ from .transforms import (
 
 from .loaders import (
     YOLODataset,
+    H5YOLODataset,
+    pack_dataset,
     DataLoaderFactory,
+    CUDAPrefetcher,
+    DALIYOLOLoader,
     InferenceDataLoader,
     create_dataloaders,
     get_dataset_info,
@@ -59,6 +65,8 @@ __all__ = [
     
     # Transforms
     'DataTransforms',
+    'NormalizeToTensor',
+    'GPUTransforms',
     'ImagePreprocessor',
     'MosaicAugmentation',
     'resize_with_padding',
@@ -68,7 +76,11 @@ __all__ = [
     
     # Loaders
     'YOLODataset',
+    'H5YOLODataset',
+    'pack_dataset',
     'DataLoaderFactory',
+    'CUDAPrefetcher',
+    'DALIYOLOLoader',
     'InferenceDataLoader',
     'create_dataloaders',
     'get_dataset_info',
@@ -0,0 +1,78 @@
+"""
+⚡ Kernels de Pré-processamento
+Normalização + conversão HWC -> CHW em uma única passada.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+def _normalize_chw_numpy(
+    src: np.ndarray, out: np.ndarray, mean: np.ndarray, inv_std: np.ndarray
+) -> None:
+    """Versão NumPy: (src - mean) * inv_std escrito direto no layout CHW."""
+    np.subtract(src.transpose(2, 0, 1), mean[:, None, None], out=out, dtype=np.float32)
+    out *= inv_std[:, None, None]
+
+
+def _normalize_chw_loop(src, out, mean, inv_std):
+    """Versão em laço de `_normalize_chw_numpy` (lê o uint8 uma vez, sem temporários), para o numba."""
+    height, width, channels = src.shape
+    # Canal no laço externo: escrita sequencial em cada plano de saída
+    for c in range(channels):
+        m = mean[c]
+        s = inv_std[c]
+        for y in range(height):
+            for x in range(width):
+                out[c, y, x] = (np.float32(src[y, x, c]) - m) * s
+
+
+@lru_cache(maxsize=1)
+def _normalize_chw_kernel():
+    """
+    Kernel de normalização, resolvido no primeiro uso: importar src.data
+    (inferência, OCR) não carrega o numba nem compila nada.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        # Sem numba, a versão NumPy (mesmo resultado)
+        return _normalize_chw_numpy
+    return njit(cache=True, nogil=True)(_normalize_chw_loop)
+
+
+def normalize_to_chw(
+    image: np.ndarray,
+    mean: np.ndarray,
+    inv_std: np.ndarray
+) -> np.ndarray:
+    """
+    Normaliza uma imagem HxWxC uint8 e devolve o array CxHxW float32 contíguo.
+
+    Equivale a `A.Normalize` + transpose do `ToTensorV2`, com a mesma
+    aritmética float32 (`(x - mean) * inv_std`, já na escala 0-255).
+
+    Args:
+        image: Imagem HxWxC uint8
+        mean: Média por canal (float32, escala 0-255)
+        inv_std: Inverso do desvio padrão por canal (float32, escala 0-255)
+
+    Returns:
+        Array CxHxW float32
+    """
+    if image.ndim == 2:
+        image = image[:, :, None]
+    image = np.ascontiguousarray(image)
+    out = np.empty((image.shape[2], image.shape[0], image.shape[1]), dtype=np.float32)
+    _normalize_chw_kernel()(image, out, mean, inv_std)
+    return out
+
+
+def warmup_normalize_kernel() -> None:
+    """Compila (ou carrega do cache em disco) o kernel antes do primeiro batch."""
+    normalize_to_chw(
+        np.zeros((1, 1, 3), dtype=np.uint8),
+        np.zeros(3, dtype=np.float32),
+        np.ones(3, dtype=np.float32)
+    )
@@ -3,16 +3,30 @@
 Converte entre diferentes formatos de datasets e anotações.
 """
 
+import errno
 import json
+import os
+import re
 import shutil
-import random
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, Iterator, List, Tuple, Optional, Union
 import xml.etree.ElementTree as ET
 
 import cv2
 import numpy as np
-import yaml
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # json.loads também aceita bytes
+    _json_loads = json.loads
+
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # lxml é opcional; ElementTree da stdlib como fallback
+    _lxml_etree = None
 from PIL import Image
 from loguru import logger
 
@@ -23,6 +37,321 @@ from ..core.exceptions import (
 )
 from ..core.constants import IMAGE_EXTENSIONS, LABEL_EXTENSIONS
 
+# Extensões normalizadas uma vez, com busca O(1)
+_IMG_EXTS = frozenset(ext.lower() for ext in IMAGE_EXTENSIONS)
+_LABEL_EXTS = frozenset(ext.lower() for ext in LABEL_EXTENSIONS)
+
+# Modos de transferência de imagens aceitos por convert_raw_to_yolo
+_LINK_MODES = ('copy', 'hardlink', 'auto')
+
+# Buffer do fallback em espaço de usuário
+_COPY_BUFFER_SIZE = 256 * 1024
+
+# O_CLOEXEC só existe em POSIX; O_BINARY só no Windows
+_O_EXTRA = getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+_O_READ = os.O_RDONLY | _O_EXTRA
+_O_WRITE = os.O_WRONLY | os.O_CREAT | _O_EXTRA  # truncado após checar o inode
+
+# Erros que indicam que a syscall não serve para este par de arquivos
+_COPY_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF
+})
+
+
+def _fast_copy(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """
+    Copia apenas o conteúdo de `src` para `dst` (sem metadados).
+
+    Tenta `os.copy_file_range` (reflink em btrfs/XFS), depois
+    `os.sendfile` e, por fim, `shutil.copyfileobj` com buffer grande.
+    """
+    src_fd = os.open(src, _O_READ)
+    try:
+        dst_fd = os.open(dst, _O_WRITE, 0o644)
+        try:
+            src_stat = os.fstat(src_fd)
+            dst_stat = os.fstat(dst_fd)
+            if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+                return  # destino é o próprio arquivo (ex: hardlink de execução anterior)
+            os.ftruncate(dst_fd, 0)
+
+            remaining = src_stat.st_size
+
+            copy_file_range = getattr(os, 'copy_file_range', None)
+            if copy_file_range is not None:
+                try:
+                    while remaining > 0:
+                        copied = copy_file_range(src_fd, dst_fd, remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                except OSError as e:
+                    if e.errno not in _COPY_FALLBACK_ERRNOS:
+                        raise
+
+            sendfile = getattr(os, 'sendfile', None)
+            if remaining > 0 and sendfile is not None:
+                try:
+                    while remaining > 0:
+                        sent = sendfile(dst_fd, src_fd, None, remaining)
+                        if sent == 0:
+                            break
+                        remaining -= sent
+                except OSError as e:
+                    if e.errno not in _COPY_FALLBACK_ERRNOS:
+                        raise
+
+            if remaining > 0:
+                # Os offsets dos descritores já refletem o que foi copiado
+                with os.fdopen(os.dup(src_fd), 'rb') as fsrc, \
+                        os.fdopen(os.dup(dst_fd), 'wb') as fdst:
+                    shutil.copyfileobj(fsrc, fdst, length=_COPY_BUFFER_SIZE)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+# Ordem das coordenadas no <bndbox> do Pascal VOC
+_VOC_BBOX_TAGS = ('xmin', 'ymin', 'xmax', 'ymax')
+
+
+# Formato de uma linha YOLO de bbox (classe única)
+_YOLO_BBOX_LINE = "0 %.6f %.6f %.6f %.6f"
+
+# Linha de bbox com classe arbitrária; `.format` ligado uma vez (spec já parseado)
+_format_bbox_line = "{} {:.6f} {:.6f} {:.6f} {:.6f}\n".format
+
+
+@lru_cache(maxsize=256)
+def _yolo_points_template(n_values: int) -> str:
+    """Template `%` de uma linha de segmentação YOLO com `n_values` coordenadas."""
+    return "0 " + " ".join(["%.6f"] * n_values)
+
+
+def _boxes_to_yolo_text(boxes: np.ndarray, img_w: int, img_h: int) -> str:
+    """
+    Converte bboxes absolutas (N, 4) [x_min, y_min, x_max, y_max] no texto YOLO.
+
+    A aritmética é feita de uma vez sobre o array e todas as linhas são
+    formatadas em uma única operação `%` sobre um template repetido N vezes.
+    """
+    x_min, y_min, x_max, y_max = boxes.T
+    out = np.column_stack((
+        (x_min + x_max) / 2 / img_w,
+        (y_min + y_max) / 2 / img_h,
+        (x_max - x_min) / img_w,
+        (y_max - y_min) / img_h,
+    ))
+
+    template = '\n'.join([_YOLO_BBOX_LINE] * len(out))
+    return template % tuple(out.ravel().tolist())
+
+
+# data.yaml gerado para o YOLO (chaves em ordem alfabética, como o yaml.dump)
+_DATA_YAML_TEMPLATE = (
+    "names:\n"
+    "- exp_date\n"
+    "nc: 1\n"
+    "path: {path}\n"
+    "{task}"
+    "test: test/images\n"
+    "train: train/images\n"
+    "val: val/images\n"
+)
+
+# Strings que não podem ser escalares YAML sem aspas
+_YAML_NEEDS_QUOTES = re.compile(
+    r"^$|^[\s\-?:,\[\]{}#&*!|>'\"%@`]|: |\s#|[:\s]$|[\x00-\x1f\x7f]")
+
+
+def _yaml_scalar(value: str) -> str:
+    """Escalar YAML: texto puro quando seguro, senão entre aspas duplas (JSON é YAML válido)."""
+    if _YAML_NEEDS_QUOTES.search(value):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+# Marcadores SOF do JPEG que carregam as dimensões (exclui DHT, JPG e DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Marcadores JPEG sem campo de tamanho
+_JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+
+
+def _parse_jpeg_size(f) -> Optional[Tuple[int, int]]:
+    """Percorre os segmentos JPEG até o primeiro SOF."""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte and byte != b'\xff':
+            byte = f.read(1)
+        while byte == b'\xff':  # bytes de preenchimento
+            byte = f.read(1)
+        if not byte:
+            return None
+
+        marker = byte[0]
+        if marker in _JPEG_STANDALONE_MARKERS:
+            continue
+
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        (length,) = struct.unpack('>H', length_bytes)
+
+        if marker in _JPEG_SOF_MARKERS:
+            sof = f.read(5)
+            if len(sof) < 5:
+                return None
+            height, width = struct.unpack('>xHH', sof)
+            return width, height
+
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _parse_image_header(f) -> Optional[Tuple[int, int]]:
+    """Lê (largura, altura) do cabeçalho de PNG, JPEG, WEBP ou BMP."""
+    head = f.read(30)
+
+    if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+        return struct.unpack('>II', head[16:24])
+
+    if head[:2] == b'\xff\xd8':
+        return _parse_jpeg_size(f)
+
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        chunk = head[12:16]
+        if chunk == b'VP8 ' and len(head) >= 30:
+            width, height = struct.unpack('<HH', head[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b'VP8L' and len(head) >= 25:
+            b0, b1, b2, b3 = head[21:25]
+            width = 1 + (((b1 & 0x3F) << 8) | b0)
+            height = 1 + (((b3 & 0x0F) << 10) | (b2 << 2) | ((b1 & 0xC0) >> 6))
+            return width, height
+        if chunk == b'VP8X' and len(head) >= 30:
+            width = 1 + int.from_bytes(head[24:27], 'little')
+            height = 1 + int.from_bytes(head[27:30], 'little')
+            return width, height
+        return None
+
+    if head[:2] == b'BM' and len(head) >= 26:
+        width, height = struct.unpack('<ii', head[18:26])
+        return width, abs(height)
+
+    return None
+
+
+def _read_image_size(path: Union[str, Path]) -> Tuple[int, int]:
+    """
+    Obtém (largura, altura) lendo apenas o cabeçalho da imagem.
+
+    Formatos sem parser dedicado (ex: TIFF) ou cabeçalhos inesperados
+    usam o PIL como fallback.
+    """
+    with open(path, 'rb') as f:
+        size = _parse_image_header(f)
+
+    if size is None:
+        with Image.open(path) as img:
+            size = img.size
+
+    return int(size[0]), int(size[1])
+
+
+@lru_cache(maxsize=100_000)
+def _image_size_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[int, int]:
+    """
+    Versão memoizada de `_read_image_size`.
+
+    A chave inclui mtime e tamanho do arquivo, então uma imagem
+    alterada no disco é relida automaticamente.
+    """
+    return _read_image_size(path_str)
+
+
+def _link_or_copy(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Cria um hardlink de `src` em `dst`; copia se o link não for possível."""
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        os.unlink(dst)
+        _link_or_copy(src, dst)
+    except OSError:
+        _fast_copy(src, dst)
+
+
+def _is_yolo_txt(label_path: Union[str, Path]) -> bool:
+    """
+    Indica se o TXT já pode ser copiado como está.
+
+    Verdadeiro quando toda linha tem ao menos 5 campos (sem linhas em
+    branco); caso contrário o arquivo passa pela limpeza linha a linha.
+    """
+    try:
+        lines = Path(label_path).read_bytes().splitlines()
+    except OSError:
+        return False
+    return bool(lines) and all(len(line.split()) >= 5 for line in lines)
+
+
+@lru_cache(maxsize=4096)
+def _labels_in(dir_str: str) -> frozenset:
+    """
+    Nomes dos arquivos de um diretório (normcase), listados uma vez.
+
+    Troca até três `Path.exists()` por imagem por um `os.listdir` por
+    diretório. O cache é limpo no início de cada conversão.
+    """
+    try:
+        return frozenset(os.path.normcase(name) for name in os.listdir(dir_str))
+    except OSError:
+        return frozenset()
+
+
+def _walk_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Percorre `root` recursivamente com `os.scandir`, gerando os arquivos.
+
+    O tipo de cada entrada vem do próprio scandir (d_type), sem um stat
+    por arquivo. Links para arquivos são incluídos; links para
+    diretórios não são seguidos (evita ciclos).
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue  # diretório ilegível, como no rglob
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+
+
+def _iter_voc_objects(label_path: Union[str, Path]) -> Iterator:
+    """
+    Itera os elementos <object> de um XML Pascal VOC em streaming.
+
+    Usa `lxml.etree.iterparse` (C) quando disponível e o ElementTree da
+    stdlib caso contrário. Cada objeto é limpo após o uso, mantendo a
+    memória constante.
+    """
+    if _lxml_etree is not None:
+        for _, obj in _lxml_etree.iterparse(str(label_path), tag='object'):
+            yield obj
+            obj.clear()
+    else:
+        for _, elem in ET.iterparse(str(label_path)):
+            if elem.tag == 'object':
+                yield elem
+                elem.clear()
+
 
 class DatasetConverter:
     """Conversor principal de datasets."""
@@ -37,7 +366,9 @@ class DatasetConverter:
         train_split: float = None,
         val_split: float = None,
         test_split: float = None,
-        task_type: str = 'detect'  # 'detect' ou 'segment'
+        task_type: str = 'detect',  # 'detect' ou 'segment'
+        seed: Optional[int] = None,
+        link_mode: str = 'copy'  # 'copy', 'hardlink' ou 'auto'
     ) -> Dict[str, int]:
         """
         Converte dados RAW para formato YOLO com divisão customizável.
@@ -49,6 +380,13 @@ class DatasetConverter:
             val_split: Proporção de validação (default: config)
             test_split: Proporção de teste (default: config)
             task_type: Tipo de tarefa ('detect' ou 'segment')
+            seed: Seed da divisão aleatória (None = não determinística)
+            link_mode: Como levar as imagens para o destino. 'copy' copia,
+                'hardlink' cria hardlinks (com cópia como fallback) e 'auto'
+                usa hardlinks quando origem e destino estão no mesmo
+                filesystem. Com hardlinks, as imagens de saída compartilham
+                os dados com as originais: não use com pipelines que
+                modificam as imagens no lugar.
 
         Returns:
             Dict com contagem de arquivos por split
@@ -56,6 +394,10 @@ class DatasetConverter:
         raw_path = Path(raw_data_path)
         output_path = Path(output_path)
 
+        if link_mode not in _LINK_MODES:
+            raise ValueError(
+                f"link_mode '{link_mode}' inválido. Disponíveis: {list(_LINK_MODES)}")
+
         # Usar splits do config se não fornecidos
         if train_split is None or val_split is None or test_split is None:
             train_split, val_split, test_split = config.get_splits()
@@ -77,6 +419,7 @@ class DatasetConverter:
                 f"Dados RAW não encontrados: {raw_path}")
 
         # Descobrir estrutura dos dados RAW
+        _labels_in.cache_clear()  # listagens de execuções anteriores podem estar velhas
         images, labels = self._discover_raw_structure(raw_path)
 
         if not images:
@@ -88,9 +431,17 @@ class DatasetConverter:
         # Criar estrutura YOLO
         self._create_yolo_structure(output_path)
 
+        # Hardlinks só funcionam dentro do mesmo filesystem (checado uma vez)
+        if link_mode == 'auto':
+            use_hardlinks = os.stat(raw_path).st_dev == os.stat(output_path).st_dev
+        else:
+            use_hardlinks = link_mode == 'hardlink'
+        if use_hardlinks:
+            logger.info("🔗 Imagens serão vinculadas com hardlinks")
+
         # Dividir dados
         splits = self._split_data(
-            images, labels, train_split, val_split, test_split)
+            images, labels, train_split, val_split, test_split, seed)
 
         # Converter e copiar arquivos
         counts = {}
@@ -99,7 +450,8 @@ class DatasetConverter:
                 f"📋 Processando split '{split_name}': {len(split_images)} arquivos")
 
             counts[split_name] = self._process_split(
-                split_images, split_labels, output_path, split_name, task_type
+                split_images, split_labels, output_path, split_name, task_type,
+                use_hardlinks
             )
 
         # Criar arquivo data.yaml
@@ -116,19 +468,22 @@ class DatasetConverter:
         labels = []
 
         # Buscar recursivamente por imagens e labels
-        for item in raw_path.rglob('*'):
-            if item.is_file():
-                suffix = item.suffix.lower()
+        for entry in _walk_files(str(raw_path)):
+            name = entry.name
+            dot = name.rfind('.')
+            if dot <= 0:  # sem extensão (ou arquivo oculto, como Path.suffix)
+                continue
+            suffix = name[dot:].lower()
 
-                if suffix in IMAGE_EXTENSIONS:
-                    images.append(item)
-                elif suffix in LABEL_EXTENSIONS:
-                    labels.append(item)
+            if suffix in _IMG_EXTS:
+                images.append(Path(entry.path))
+            elif suffix in _LABEL_EXTS:
+                labels.append(Path(entry.path))
 
-        # Ordenar para consistência
+        # Ordem estável (a do os.scandir depende do sistema de arquivos): a
+        # mesma seed gera a mesma divisão em qualquer máquina
         images.sort()
         labels.sort()
-
         return images, labels
 
     def _create_yolo_structure(self, output_path: Path) -> None:
@@ -148,38 +503,32 @@ class DatasetConverter:
         labels: List[Path],
         train_split: float,
         val_split: float,
-        test_split: float
-    ) -> Dict[str, Tuple[List[Path], List[Path]]]:
-        """Divide dados em train/val/test."""
-
-        # Criar pares imagem-label
-        pairs = self._match_images_labels(images, labels)
+        test_split: float,
+        seed: Optional[int] = None
+    ) -> Dict[str, Tuple[List[Path], List[Optional[Path]]]]:
+        """Divide dados em train/val/test (labels já resolvidos por imagem)."""
 
-        # Embaralhar para aleatoriedade
-        random.shuffle(pairs)
+        # Label de cada imagem como array paralelo (sem lista de tuplas)
+        label_dict = {label.stem: label for label in labels}
+        matched_labels = [self._find_label_for_image(image, label_dict)
+                          for image in images]
 
-        total = len(pairs)
+        # Permutação aleatória dos índices (O(N), sem embaralhar a lista)
+        total = len(images)
         train_end = int(total * train_split)
         val_end = train_end + int(total * val_split)
 
-        splits = {
-            'train': ([], []),
-            'val': ([], []),
-            'test': ([], [])
-        }
-
-        # Dividir pares
-        for i, (img_path, label_path) in enumerate(pairs):
-            if i < train_end:
-                split_name = 'train'
-            elif i < val_end:
-                split_name = 'val'
-            else:
-                split_name = 'test'
+        indices = np.random.default_rng(seed).permutation(total)
+        split_indices = np.split(indices, [train_end, val_end])
 
-            splits[split_name][0].append(img_path)
-            if label_path:
-                splits[split_name][1].append(label_path)
+        splits = {}
+        for split_name, idx in zip(('train', 'val', 'test'), split_indices):
+            idx = idx.tolist()
+            # Labels alinhados às imagens (None quando não há label)
+            splits[split_name] = (
+                [images[i] for i in idx],
+                [matched_labels[i] for i in idx]
+            )
 
         return splits
 
@@ -188,20 +537,22 @@ class DatasetConverter:
         # Primeiro tentar pelo dicionário (mais rápido)
         matching_label = label_dict.get(image_path.stem)
 
-        # Se não encontrou, tentar buscar diretamente na estrutura de arquivos
+        # Se não encontrou, procurar nos diretórios usuais (listagens em cache)
         if not matching_label:
-            possible_label_paths = [
+            label_name = f"{image_path.stem}.txt"
+            key = os.path.normcase(label_name)
+            parent = image_path.parent
+
+            for label_dir in (
                 # Pasta labels no mesmo nível que images (estrutura Roboflow)
-                image_path.parent.parent / "labels" / f"{image_path.stem}.txt",
+                parent.parent / "labels",
                 # Pasta labels no mesmo nível da pasta images
-                image_path.parent / "labels" / f"{image_path.stem}.txt",
+                parent / "labels",
                 # Label no mesmo diretório
-                image_path.with_suffix('.txt'),
-            ]
-
-            for label_path in possible_label_paths:
-                if label_path.exists():
-                    matching_label = label_path
+                parent,
+            ):
+                if key in _labels_in(str(label_dir)):
+                    matching_label = label_dir / label_name
                     break
 
         return matching_label
@@ -222,63 +573,55 @@ class DatasetConverter:
     def _process_split(
         self,
         images: List[Path],
-        labels: List[Path],
+        labels: List[Optional[Path]],
         output_path: Path,
         split_name: str,
-        task_type: str
+        task_type: str,
+        use_hardlinks: bool = False
     ) -> int:
-        """Processa um split específico."""
+        """
+        Processa um split específico.
+
+        `labels` é alinhado a `images` (resolvido em `_split_data`),
+        então não há nova busca de labels no disco aqui.
+        """
 
         images_dir = output_path / split_name / 'images'
         labels_dir = output_path / split_name / 'labels'
 
-        processed_count = 0
-
-        # Criar dicionário de labels
-        label_dict = {label.stem: label for label in labels}
-
-        for image_path in images:
-            try:
-                # Copiar imagem
-                dest_image = images_dir / image_path.name
-                shutil.copy2(image_path, dest_image)
-
-                # Processar label se existir
-                label_path = label_dict.get(image_path.stem)
-
-                # Se não encontrou no dicionário, tentar buscar diretamente
-                if not label_path:
-                    possible_label_paths = [
-                        # Pasta labels no mesmo nível que images
-                        image_path.parent.parent / "labels" /
-                        f"{image_path.stem}.txt",
-                        # Pasta labels no mesmo nível da pasta images
-                        image_path.parent / "labels" /
-                        f"{image_path.stem}.txt",
-                        # Label no mesmo diretório
-                        image_path.with_suffix('.txt'),
-                    ]
-
-                    for possible_path in possible_label_paths:
-                        if possible_path.exists():
-                            label_path = possible_path
-                            break
-
-                if label_path:
-                    dest_label = labels_dir / f"{image_path.stem}.txt"
-
-                    # Converter label baseado no formato original
-                    self._convert_label(
-                        label_path, dest_label, image_path, task_type)
-                else:
-                    logger.warning(
-                        f"⚠️ Label não encontrado para: {image_path.name}")
-
-                processed_count += 1
+        n_items = len(images)
+        if not n_items:
+            return 0
+
+        args = (
+            images,
+            labels,
+            [images_dir] * n_items,
+            [labels_dir] * n_items,
+            [task_type] * n_items,
+            [use_hardlinks] * n_items,
+        )
+
+        max_workers = min(os.cpu_count() or 1, -(-n_items // _PROCESS_CHUNKSIZE))
+        if max_workers > 1 and n_items >= _PARALLEL_MIN_IMAGES:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    _process_one, *args, chunksize=_PROCESS_CHUNKSIZE))
+        else:
+            # Poucos arquivos: o custo de subir processos não compensa
+            results = list(map(_process_one, *args))
 
-            except Exception as e:
+        # Logs só no processo principal
+        processed_count = 0
+        for image_name, status, error in results:
+            if status == _STATUS_ERROR:
                 logger.warning(
-                    f"⚠️ Erro processando {image_path.name}: {str(e)}")
+                    f"⚠️ Erro processando {image_name}: {error}")
+                continue
+            if status == _STATUS_NO_LABEL:
+                logger.warning(
+                    f"⚠️ Label não encontrado para: {image_name}")
+            processed_count += 1
 
         return processed_count
 
@@ -287,8 +630,9 @@ class DatasetConverter:
 
         # Obter dimensões da imagem
         try:
-            with Image.open(image_path) as img:
-                img_width, img_height = img.size
+            st = os.stat(image_path)
+            img_width, img_height = _image_size_cached(
+                str(image_path), st.st_mtime_ns, st.st_size)
         except Exception as e:
             logger.warning(
                 f"⚠️ Não foi possível ler dimensões de {image_path}: {str(e)}")
@@ -298,20 +642,31 @@ class DatasetConverter:
         suffix = label_path.suffix.lower()
 
         if suffix == '.txt':
-            # Já pode estar em formato YOLO
-            self._convert_txt_label(
-                label_path, dest_path, img_width, img_height, task_type)
+            # Já em formato YOLO (caso comum): cópia direta, sem reescrever
+            if _is_yolo_txt(label_path):
+                _fast_copy(label_path, dest_path)
+                return
+            text = self._convert_txt_label(
+                label_path, img_width, img_height, task_type)
         elif suffix == '.json':
-            self._convert_json_label(
-                label_path, dest_path, img_width, img_height, task_type)
+            text = self._convert_json_label(
+                label_path, img_width, img_height, task_type)
         elif suffix == '.xml':
-            self._convert_xml_label(
-                label_path, dest_path, img_width, img_height, task_type)
+            text = self._convert_xml_label(
+                label_path, img_width, img_height, task_type)
         else:
             logger.warning(f"⚠️ Formato de label não suportado: {suffix}")
+            return
 
-    def _convert_txt_label(self, label_path: Path, dest_path: Path, img_w: int, img_h: int, task_type: str) -> None:
-        """Converte label TXT (pode já estar em formato YOLO)."""
+        if text is None:
+            return
+
+        # Um único write sem buffer intermediário
+        with open(dest_path, 'wb', buffering=0) as f:
+            f.write(text.encode('utf-8'))
+
+    def _convert_txt_label(self, label_path: Path, img_w: int, img_h: int, task_type: str) -> Optional[str]:
+        """Converte label TXT (pode já estar em formato YOLO). Retorna o conteúdo YOLO."""
         try:
             with open(label_path, 'r') as f:
                 lines = f.readlines()
@@ -330,117 +685,130 @@ class DatasetConverter:
                 else:
                     logger.warning(f"⚠️ Linha inválida ignorada: {line}")
 
-            # Salvar linhas YOLO
-            with open(dest_path, 'w') as f:
-                f.write('\n'.join(yolo_lines))
+            return '\n'.join(yolo_lines)
 
         except Exception as e:
             logger.error(f"❌ Erro convertendo {label_path}: {str(e)}")
+            return None
 
-    def _convert_json_label(self, label_path: Path, dest_path: Path, img_w: int, img_h: int, task_type: str) -> None:
-        """Converte label JSON (formato COCO ou Roboflow)."""
+    def _convert_json_label(self, label_path: Path, img_w: int, img_h: int, task_type: str) -> Optional[str]:
+        """Converte label JSON (formato COCO ou Roboflow). Retorna o conteúdo YOLO."""
         try:
-            with open(label_path, 'r') as f:
-                data = json.load(f)
+            data = _json_loads(Path(label_path).read_bytes())
 
             yolo_lines = []
 
             # Detectar formato
             if 'shapes' in data:  # Formato LabelMe/Roboflow
-                for shape in data['shapes']:
-                    if task_type == 'detect':
-                        # Converter polígono para bbox
+                shapes = data['shapes']
+                if task_type == 'detect':
+                    # Converter polígonos para bbox [x_min, y_min, x_max, y_max]
+                    boxes = np.empty((len(shapes), 4), dtype=np.float64)
+                    for i, shape in enumerate(shapes):
+                        points = np.asarray(
+                            shape['points'], dtype=np.float64).reshape(-1, 2)
+                        boxes[i, :2] = points.min(axis=0)
+                        boxes[i, 2:] = points.max(axis=0)
+
+                    return _boxes_to_yolo_text(boxes, img_w, img_h)
+
+                elif task_type == 'segment':
+                    for shape in shapes:
+                        # Manter pontos para segmentação
                         points = shape['points']
-                        x_coords = [p[0] for p in points]
-                        y_coords = [p[1] for p in points]
+                        normalized = (np.asarray(points, dtype=np.float64).reshape(-1, 2)
+                                      / (img_w, img_h)).ravel().tolist()
+                        yolo_lines.append(
+                            _yolo_points_template(len(normalized)) % tuple(normalized))
 
-                        x_min, x_max = min(x_coords), max(x_coords)
-                        y_min, y_max = min(y_coords), max(y_coords)
+            return '\n'.join(yolo_lines)
 
-                        # Normalizar e converter para YOLO
-                        x_center = (x_min + x_max) / 2 / img_w
-                        y_center = (y_min + y_max) / 2 / img_h
-                        width = (x_max - x_min) / img_w
-                        height = (y_max - y_min) / img_h
+        except Exception as e:
+            logger.error(f"❌ Erro convertendo JSON {label_path}: {str(e)}")
+            return None
 
-                        yolo_lines.append(
-                            f"0 {x_center:.6f} {y_center:.6f} {width:.6f} {height:.6f}")
+    def _convert_xml_label(self, label_path: Path, img_w: int, img_h: int, task_type: str) -> Optional[str]:
+        """Converte label XML (formato Pascal VOC). Retorna o conteúdo YOLO."""
+        try:
+            # Coordenadas de todos os objetos da nossa classe em um único array
+            boxes = np.fromiter(
+                (float(obj.find('bndbox').find(tag).text)
+                 for obj in _iter_voc_objects(label_path)
+                 if obj.find('name').text == 'exp_date'
+                 for tag in _VOC_BBOX_TAGS),
+                dtype=np.float64
+            ).reshape(-1, 4)
 
-                    elif task_type == 'segment':
-                        # Manter pontos para segmentação
-                        points = shape['points']
-                        normalized_points = []
-                        for x, y in points:
-                            normalized_points.extend([x/img_w, y/img_h])
+            return _boxes_to_yolo_text(boxes, img_w, img_h)
 
-                        points_str = ' '.join(
-                            f"{p:.6f}" for p in normalized_points)
-                        yolo_lines.append(f"0 {points_str}")
+        except Exception as e:
+            logger.error(f"❌ Erro convertendo XML {label_path}: {str(e)}")
+            return None
 
-            # Salvar arquivo YOLO
-            with open(dest_path, 'w') as f:
-                f.write('\n'.join(yolo_lines))
+    def _create_data_yaml(self, output_path: Path, task_type: str) -> None:
+        """Cria arquivo data.yaml para YOLO."""
 
-        except Exception as e:
-            logger.error(f"❌ Erro convertendo JSON {label_path}: {str(e)}")
+        # Template fixo (mesma saída do yaml.dump, chaves em ordem alfabética);
+        # evita importar o PyYAML só para este arquivo de poucas linhas
+        yaml_text = _DATA_YAML_TEMPLATE.format(
+            path=_yaml_scalar(str(output_path.resolve())),
+            task='task: segment\n' if task_type == 'segment' else ''
+        )
 
-    def _convert_xml_label(self, label_path: Path, dest_path: Path, img_w: int, img_h: int, task_type: str) -> None:
-        """Converte label XML (formato Pascal VOC)."""
-        try:
-            tree = ET.parse(label_path)
-            root = tree.getroot()
+        yaml_path = output_path / 'data.yaml'
+        yaml_path.write_text(yaml_text, encoding='utf-8')
 
-            yolo_lines = []
+        logger.info(f"📄 Arquivo data.yaml criado: {yaml_path}")
 
-            for obj in root.findall('object'):
-                name = obj.find('name').text
-                if name != 'exp_date':  # Filtrar apenas nossa classe
-                    continue
 
-                bbox = obj.find('bndbox')
-                x_min = float(bbox.find('xmin').text)
-                y_min = float(bbox.find('ymin').text)
-                x_max = float(bbox.find('xmax').text)
-                y_max = float(bbox.find('ymax').text)
+# ========================================
+# PROCESSAMENTO PARALELO DE SPLITS
+# ========================================
 
-                # Converter para YOLO
-                x_center = (x_min + x_max) / 2 / img_w
-                y_center = (y_min + y_max) / 2 / img_h
-                width = (x_max - x_min) / img_w
-                height = (y_max - y_min) / img_h
+# Status retornados por _process_one
+_STATUS_OK = 'ok'
+_STATUS_NO_LABEL = 'no_label'
+_STATUS_ERROR = 'error'
 
-                yolo_lines.append(
-                    f"0 {x_center:.6f} {y_center:.6f} {width:.6f} {height:.6f}")
+# Abaixo disso o split é processado no próprio processo
+_PARALLEL_MIN_IMAGES = 64
+_PROCESS_CHUNKSIZE = 32
 
-            # Salvar arquivo YOLO
-            with open(dest_path, 'w') as f:
-                f.write('\n'.join(yolo_lines))
+_worker_converter: Optional[DatasetConverter] = None
 
-        except Exception as e:
-            logger.error(f"❌ Erro convertendo XML {label_path}: {str(e)}")
 
-    def _create_data_yaml(self, output_path: Path, task_type: str) -> None:
-        """Cria arquivo data.yaml para YOLO."""
+def _process_one(
+    image_path: Path,
+    label_path: Optional[Path],
+    images_dir: Path,
+    labels_dir: Path,
+    task_type: str,
+    use_hardlink: bool = False
+) -> Tuple[str, str, Optional[str]]:
+    """
+    Copia uma imagem e converte seu label (executado nos workers).
 
-        yaml_content = {
-            'path': str(output_path.resolve()),
-            'train': 'train/images',
-            'val': 'val/images',
-            'test': 'test/images',
-            'nc': 1,
-            'names': ['exp_date']
-        }
+    Returns:
+        (nome_da_imagem, status, mensagem_de_erro)
+    """
+    global _worker_converter
+    if _worker_converter is None:
+        _worker_converter = DatasetConverter()
 
-        if task_type == 'segment':
-            yaml_content['task'] = 'segment'
+    try:
+        place = _link_or_copy if use_hardlink else _fast_copy
+        place(image_path, images_dir / image_path.name)
 
-        yaml_path = output_path / 'data.yaml'
+        if not label_path:
+            return image_path.name, _STATUS_NO_LABEL, None
 
-        with open(yaml_path, 'w', encoding='utf-8') as f:
-            yaml.dump(yaml_content, f, default_flow_style=False,
-                      allow_unicode=True)
+        dest_label = labels_dir / f"{image_path.stem}.txt"
+        _worker_converter._convert_label(
+            label_path, dest_label, image_path, task_type)
+        return image_path.name, _STATUS_OK, None
 
-        logger.info(f"📄 Arquivo data.yaml criado: {yaml_path}")
+    except Exception as e:
+        return image_path.name, _STATUS_ERROR, str(e)
 
 
 # ========================================
@@ -512,6 +880,51 @@ def yolo_to_bbox(yolo_coords: List[float], img_width: int, img_height: int) -> L
     return [x_min, y_min, x_max, y_max]
 
 
+def _polygon_to_bbox_numpy(coords: np.ndarray) -> Tuple[float, float, float, float]:
+    """Polígono achatado [x1, y1, x2, y2, ...] -> (x_center, y_center, width, height)."""
+    points = coords.reshape(-1, 2)
+    x_min, y_min = points.min(axis=0).tolist()
+    x_max, y_max = points.max(axis=0).tolist()
+    return (x_min + x_max) / 2, (y_min + y_max) / 2, x_max - x_min, y_max - y_min
+
+
+def _polygon_to_bbox_loop(coords):
+    """Versão em laço de `_polygon_to_bbox_numpy` (uma passada, sem temporários), para o numba."""
+    x_min = x_max = coords[0]
+    y_min = y_max = coords[1]
+    for i in range(2, coords.shape[0] - 1, 2):
+        x = coords[i]
+        y = coords[i + 1]
+        if x < x_min:
+            x_min = x
+        elif x > x_max:
+            x_max = x
+        if y < y_min:
+            y_min = y
+        elif y > y_max:
+            y_max = y
+    return (x_min + x_max) / 2, (y_min + y_max) / 2, x_max - x_min, y_max - y_min
+
+
+@lru_cache(maxsize=1)
+def _polygon_to_bbox_kernel():
+    """
+    Kernel de `_polygon_to_bbox`, resolvido no primeiro uso: o numba só é
+    importado (e o kernel compilado) quando há polígonos para converter.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        # Sem numba, a versão NumPy (mesmo resultado)
+        return _polygon_to_bbox_numpy
+    return njit(cache=True)(_polygon_to_bbox_loop)
+
+
+def _polygon_to_bbox(coords: np.ndarray) -> Tuple[float, float, float, float]:
+    """Polígono achatado [x1, y1, x2, y2, ...] -> (x_center, y_center, width, height)."""
+    return _polygon_to_bbox_kernel()(coords)
+
+
 # ========================================
 # FUNÇÕES DE CONVENIÊNCIA
 # ========================================
@@ -583,23 +996,12 @@ def convert_polygons_to_bbox(input_label_path: Path, output_label_path: Path) ->
 
             # Se é polígono (múltiplos pares x,y)
             if len(coords) >= 6 and len(coords) % 2 == 0:
-                # Converter polígono para bbox
-                x_coords = coords[::2]  # coordenadas x (índices pares)
-                y_coords = coords[1::2]  # coordenadas y (índices ímpares)
-
-                x_min = min(x_coords)
-                x_max = max(x_coords)
-                y_min = min(y_coords)
-                y_max = max(y_coords)
-
-                # Calcular centro e dimensões (formato YOLO)
-                x_center = (x_min + x_max) / 2
-                y_center = (y_min + y_max) / 2
-                width = x_max - x_min
-                height = y_max - y_min
-
-                bbox_line = f"{class_id} {x_center:.6f} {y_center:.6f} {width:.6f} {height:.6f}\n"
-                converted_lines.append(bbox_line)
+                # Converter polígono para bbox (centro e dimensões, formato YOLO)
+                x_center, y_center, width, height = _polygon_to_bbox(
+                    np.asarray(coords, dtype=np.float64))
+
+                converted_lines.append(
+                    _format_bbox_line(class_id, x_center, y_center, width, height))
             else:
                 # Formato não reconhecido, pular
                 logger.warning(f"⚠️ Formato não reconhecido na linha: {line}")
@@ -612,4 +1014,4 @@ def convert_polygons_to_bbox(input_label_path: Path, output_label_path: Path) ->
     except Exception as e:
         logger.error(f"❌ Erro convertendo {input_label_path}: {str(e)}")
         # Copiar arquivo original em caso de erro
-        shutil.copy2(input_label_path, output_label_path)
+        _fast_copy(input_label_path, output_label_path)
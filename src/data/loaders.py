@@ -3,7 +3,14 @@
 Carrega e processa datasets para treinamento e inferência.
 """
 
+import hashlib
+import io
+import os
 import random
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union, Iterator
 import json
@@ -11,27 +18,171 @@ import json
 import cv2
 import numpy as np
 import torch
-from torch.utils.data import Dataset, DataLoader, random_split
-from PIL import Image
+from torch.utils.data import Dataset, DataLoader, random_split, get_worker_info
+from PIL import Image, ImageOps
 import yaml
 from loguru import logger
 
+# Decodificação JPEG direto em RGB via libjpeg-turbo (opcional):
+#   pip install PyTurboJPEG   (requer a libturbojpeg do sistema)
+# Para os demais formatos o PIL é usado; o Pillow-SIMD (pip install
+# pillow-simd, substitui o Pillow) acelera esse caminho sem mudar o código.
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+except ImportError:
+    TurboJPEG = None
+
+# Backend opcional de decodificação na GPU (nvJPEG):
+#   pip install nvidia-dali-cuda120 --extra-index-url https://pypi.nvidia.com
+try:
+    from nvidia.dali import fn, pipeline_def
+    from nvidia.dali import types as dali_types
+    from nvidia.dali.plugin.pytorch import DALIGenericIterator, LastBatchPolicy
+    DALI_AVAILABLE = True
+except ImportError:
+    DALI_AVAILABLE = False
+
+# Dataset empacotado em um único arquivo HDF5 (opcional): pip install h5py
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
 from ..core.config import config
 from ..core.exceptions import DatasetNotFoundError, InvalidImageFormatError, CorruptedImageError
 from ..core.constants import IMAGE_EXTENSIONS
-from .transforms import DataTransforms, ImagePreprocessor
+from .transforms import DataTransforms, ImagePreprocessor, worker_init_opencv
+
+
+# Tupla para str.endswith (um único teste em C por nome de arquivo)
+_IMAGE_EXT_TUPLE = tuple(sorted({ext.lower() for ext in IMAGE_EXTENSIONS}))
+
+# Versão do parse gravado em .{split}.labels.cache.npz (entra na assinatura:
+# incrementar descarta caches gerados por versões anteriores do parser)
+_LABEL_CACHE_VERSION = 2
+
+
+def _list_images(directory: Path) -> List[Path]:
+    """Imagens de um diretório (não recursivo), ordenadas por nome, em um único scandir."""
+    with os.scandir(directory) as it:
+        names = [
+            entry.name for entry in it
+            if entry.name.lower().endswith(_IMAGE_EXT_TUPLE) and entry.is_file()
+        ]
+    names.sort()
+    return [directory / name for name in names]
+
+
+def _list_file_names(directory: Path) -> frozenset:
+    """Nomes dos arquivos de um diretório (vazio se não existir)."""
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(entry.name for entry in it if entry.is_file())
+    except OSError:
+        return frozenset()
+
+
+_JPEG_SUFFIXES = frozenset({'.jpg', '.jpeg'})
+_EXIF_ORIENTATION = 0x0112
+
+_turbo = None  # instância criada no primeiro uso (False = indisponível)
+
+
+def _get_turbo():
+    """Retorna o decodificador TurboJPEG, ou None se indisponível."""
+    global _turbo
+    if _turbo is None:
+        try:
+            _turbo = TurboJPEG() if TurboJPEG is not None else False
+        except Exception:  # biblioteca nativa ausente
+            _turbo = False
+    return _turbo or None
+
+
+def _decode_pil_rgb(source) -> np.ndarray:
+    """Decodifica com PIL em RGB, aplicando a orientação EXIF (como o cv2.imread)."""
+    with Image.open(source) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        return np.asarray(img)
+
+
+def _decode_image_bytes(buf: bytes) -> np.ndarray:
+    """Decodifica bytes de imagem em RGB (TurboJPEG para JPEG, senão PIL)."""
+    turbo = _get_turbo()
+    if turbo is not None and buf[:2] == b'\xff\xd8':
+        # Só o cabeçalho é lido aqui; rotação EXIF é rara
+        with Image.open(io.BytesIO(buf)) as img:
+            orientation = img.getexif().get(_EXIF_ORIENTATION, 1)
+        if orientation == 1:
+            return turbo.decode(buf, pixel_format=TJPF_RGB)
+    return _decode_pil_rgb(io.BytesIO(buf))
+
+
+# OpenCV >= 4.10 decodifica direto em RGB (sem o passe do cvtColor)
+_CV2_IMREAD_RGB = getattr(cv2, 'IMREAD_COLOR_RGB', None)
+
+
+def _cv2_decode_rgb(buf: np.ndarray) -> Optional[np.ndarray]:
+    """Decodifica bytes (array uint8) com o cv2 em RGB; None se falhar."""
+    if _CV2_IMREAD_RGB is not None:
+        return cv2.imdecode(buf, _CV2_IMREAD_RGB)
+    image = cv2.imdecode(buf, cv2.IMREAD_COLOR)
+    if image is None:
+        return None
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+
+def _read_image_rgb(img_path: Path) -> np.ndarray:
+    """
+    Lê uma imagem já em RGB (HxWx3 uint8), sem o passe extra do cvtColor.
+
+    JPEGs usam o TurboJPEG quando disponível; os demais formatos (e
+    JPEGs com rotação EXIF) usam o PIL. O cv2 fica como fallback.
+    """
+    try:
+        if _get_turbo() is not None and img_path.suffix.lower() in _JPEG_SUFFIXES:
+            return _decode_image_bytes(img_path.read_bytes())
+
+        return _decode_pil_rgb(img_path)
+
+    except Exception:
+        # np.fromfile + imdecode também funciona com caminhos não-ASCII
+        try:
+            image = _cv2_decode_rgb(np.fromfile(img_path, dtype=np.uint8))
+        except OSError:
+            image = None
+        if image is None:
+            raise CorruptedImageError(f"Não foi possível carregar: {img_path}")
+        return image
+
+
+def _release_shared_memory(shm: SharedMemory, owner_pid: int) -> None:
+    """Fecha o bloco de memória compartilhada; só o processo criador o remove."""
+    try:
+        shm.close()
+    except BufferError:
+        pass  # ainda há views vivas; o mapeamento some com o processo
+    if os.getpid() == owner_pid:
+        shm.unlink()
 
 
 class YOLODataset(Dataset):
     """Dataset customizado para YOLO."""
     
+    # Imagem preta do item de fallback (compartilhada, somente-leitura)
+    _FALLBACK_IMAGE = np.zeros((640, 640, 3), dtype=np.uint8)
+    _FALLBACK_IMAGE.setflags(write=False)
+    
     def __init__(
         self,
         data_path: Union[str, Path],
         split: str = 'train',
         transforms=None,
         task_type: str = 'detect',
-        cache_images: bool = False
+        cache_images: bool = False,
+        decode_threads: int = 0
     ):
         """
         Args:
@@ -39,16 +190,20 @@ class YOLODataset(Dataset):
             split: 'train', 'val' ou 'test'
             transforms: Transformações do Albumentations
             task_type: 'detect' ou 'segment'
-            cache_images: Cache imagens na memória (usar apenas para datasets pequenos)
+            cache_images: Cache das imagens decodificadas em um arquivo
+                memmap no diretório do dataset (compartilhado entre workers
+                e reaproveitado entre execuções). Sem permissão de escrita,
+                usa memória compartilhada entre os workers (apenas datasets pequenos)
+            decode_threads: Threads para carregar os itens de um mesmo batch
+                em paralelo dentro do worker (0 ou 1 = sequencial)
         """
         self.data_path = Path(data_path)
         self.split = split
         self.transforms = transforms
         self.task_type = task_type
         self.cache_images = cache_images
-        
-        # Cache de imagens
-        self.image_cache = {} if cache_images else None
+        self.decode_threads = decode_threads
+        self._decode_pool: Optional[ThreadPoolExecutor] = None  # criado no worker
         
         # Carregar configuração do dataset
         self.data_config = self._load_data_config()
@@ -58,13 +213,55 @@ class YOLODataset(Dataset):
         
         logger.info(f"📁 Dataset carregado: {len(self.image_paths)} imagens ({split})")
         
-        if cache_images and len(self.image_paths) < 1000:  # Cache apenas datasets pequenos
-            logger.info("💾 Cacheando imagens na memória...")
-            self._cache_all_images()
+        # Labels de todas as imagens em um único array (classe + bbox por linha)
+        self._label_rows: Optional[np.ndarray] = None
+        self._label_offsets: Optional[np.ndarray] = None
+        self._init_label_cache()
+        
+        # Cache de imagens: um único buffer com os pixels + índice de offsets,
+        # em arquivo (memmap) ou em memória compartilhada entre os workers
+        self._mm: Optional[np.ndarray] = None
+        self._mm_path: Optional[Path] = None
+        self._mm_offsets: Optional[np.ndarray] = None
+        self._mm_shapes: Optional[np.ndarray] = None
+        self._shm: Optional[SharedMemory] = None
+        self._shm_name: Optional[str] = None
+        
+        if cache_images:
+            try:
+                self._init_disk_cache()
+            except OSError as e:
+                logger.warning(f"⚠️ Cache em disco indisponível ({e}); usando memória")
+                if len(self.image_paths) < 1000:  # Cache apenas datasets pequenos
+                    logger.info("💾 Cacheando imagens na memória compartilhada...")
+                    self._init_shared_cache()
     
     def __len__(self) -> int:
         return len(self.image_paths)
     
+    def __getstate__(self) -> Dict:
+        # O cache é reaberto no worker; pickle copiaria todos os pixels
+        state = self.__dict__.copy()
+        state['_mm'] = None
+        state['_shm'] = None
+        state['_decode_pool'] = None
+        return state
+    
+    def __getitems__(self, indices: List[int]) -> List[Dict]:
+        """
+        Carrega os itens de um batch (usado pelo DataLoader do PyTorch 2.x).
+
+        Com `decode_threads > 1`, os itens são carregados em paralelo: a
+        decodificação (cv2/PIL/TurboJPEG) libera o GIL, então o primeiro
+        batch não espera `batch_size` decodificações em sequência.
+        """
+        if self.decode_threads <= 1 or len(indices) <= 1:
+            return [self[idx] for idx in indices]
+        
+        if self._decode_pool is None:
+            self._decode_pool = ThreadPoolExecutor(max_workers=self.decode_threads)
+        return list(self._decode_pool.map(self.__getitem__, indices))
+    
     def __getitem__(self, idx: int) -> Dict:
         """
         Retorna um item do dataset.
@@ -72,13 +269,13 @@ class YOLODataset(Dataset):
         Returns:
             Dict com 'image', 'bboxes', 'class_labels', 'image_path'
         """
+        # Labels já estão em memória (parse feito na construção)
+        bboxes, class_labels = self._load_labels(idx)
+        
         try:
-            # Carregar imagem
+            # Carregar imagem (imagens ilegíveis já foram descartadas na construção)
             image = self._load_image(idx)
             
-            # Carregar labels
-            bboxes, class_labels = self._load_labels(idx)
-            
             # Aplicar transformações
             if self.transforms:
                 if self.task_type == 'detect' and bboxes:
@@ -96,17 +293,17 @@ class YOLODataset(Dataset):
                     transformed = self.transforms(image=image)
                     image = transformed['image']
             
-            return {
-                'image': image,
-                'bboxes': bboxes,
-                'class_labels': class_labels,
-                'image_path': str(self.image_paths[idx])
-            }
-            
-        except Exception as e:
+        except (CorruptedImageError, ValueError) as e:
+            # Arquivo corrompido em disco ou bbox rejeitada pelo Albumentations
             logger.error(f"❌ Erro carregando item {idx}: {str(e)}")
-            # Retornar item válido em caso de erro
             return self._get_fallback_item()
+        
+        return {
+            'image': image,
+            'bboxes': bboxes,
+            'class_labels': class_labels,
+            'image_path': str(self.image_paths[idx])
+        }
     
     def _load_data_config(self) -> Dict:
         """Carrega configuração do data.yaml."""
@@ -134,18 +331,16 @@ class YOLODataset(Dataset):
         if not images_dir.exists():
             raise DatasetNotFoundError(f"Diretório de imagens não encontrado: {images_dir}")
         
-        # Buscar imagens
-        image_paths = []
-        for ext in IMAGE_EXTENSIONS:
-            image_paths.extend(images_dir.glob(f"*{ext}"))
+        # Buscar imagens (uma única listagem do diretório, filtrada por extensão;
+        # arquivos ilegíveis caem no CorruptedImageError de __getitem__)
+        image_paths = _list_images(images_dir)
         
-        image_paths.sort()
-        
-        # Buscar labels correspondentes
+        # Buscar labels correspondentes (um scandir em vez de um stat por imagem)
+        label_names = _list_file_names(labels_dir)
         label_paths = []
         for img_path in image_paths:
-            label_path = labels_dir / f"{img_path.stem}.txt"
-            label_paths.append(label_path if label_path.exists() else None)
+            label_name = f"{img_path.stem}.txt"
+            label_paths.append(labels_dir / label_name if label_name in label_names else None)
         
         return image_paths, label_paths
     
@@ -153,23 +348,15 @@ class YOLODataset(Dataset):
         """Carrega uma imagem."""
         img_path = self.image_paths[idx]
         
-        # Verificar cache primeiro
-        if self.image_cache and str(img_path) in self.image_cache:
-            return self.image_cache[str(img_path)].copy()
+        # Verificar cache primeiro (os transforms não alteram a imagem de entrada)
+        if self._mm_offsets is not None:
+            cached = self._cache_view(idx)
+            if cached is not None:
+                return cached
         
         # Carregar do disco
         try:
-            image = cv2.imread(str(img_path))
-            if image is None:
-                raise CorruptedImageError(f"Não foi possível carregar: {img_path}")
-            
-            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            # Cache se habilitado
-            if self.image_cache:
-                self.image_cache[str(img_path)] = image.copy()
-            
-            return image
+            return _read_image_rgb(img_path)
             
         except Exception as e:
             logger.error(f"❌ Erro carregando imagem {img_path}: {str(e)}")
@@ -177,53 +364,241 @@ class YOLODataset(Dataset):
     
     def _load_labels(self, idx: int) -> Tuple[List[List[float]], List[int]]:
         """Carrega labels YOLO."""
+        if self._label_offsets is not None:
+            rows = self._label_rows[self._label_offsets[idx]:self._label_offsets[idx + 1]]
+            return rows[:, 1:5].tolist(), rows[:, 0].astype(np.int64).tolist()
+        
+        return self._read_label_file(idx)
+    
+    def _read_label_file(self, idx: int) -> Tuple[List[List[float]], List[int]]:
+        """Lê e faz o parse do arquivo de labels YOLO."""
         label_path = self.label_paths[idx]
         
-        if label_path is None or not label_path.exists():
+        if label_path is None:  # existência já verificada em _load_file_paths
             return [], []
         
         try:
-            bboxes = []
-            class_labels = []
+            # Caso comum (exatamente 5 colunas em cada linha): um read, parse em C
+            with open(label_path, 'rb') as f:
+                data = f.read()
+            rows = [fields for fields in map(bytes.split, data.splitlines()) if fields]
+            if all(len(fields) == 5 for fields in rows):
+                try:
+                    arr = np.array(rows, dtype=np.float64).reshape(-1, 5)
+                    return arr[:, 1:5].tolist(), arr[:, 0].astype(np.int64).tolist()
+                except ValueError:
+                    pass  # token não numérico: deixa para o parse completo
             
-            with open(label_path, 'r') as f:
-                lines = f.readlines()
+            # Parse em C de todas as linhas de uma vez
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', UserWarning)  # arquivo vazio
+                    arr = np.loadtxt(label_path, dtype=np.float64, ndmin=2)
+            except ValueError:
+                # Número de colunas variável (ex: polígonos): parse linha a linha
+                return self._parse_label_lines(label_path)
             
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                parts = line.split()
-                if len(parts) < 5:
-                    continue
-                
-                class_id = int(parts[0])
-                coords = [float(x) for x in parts[1:5]]
-                
-                bboxes.append(coords)
-                class_labels.append(class_id)
+            if arr.shape[1] < 5:
+                return [], []
             
-            return bboxes, class_labels
+            return arr[:, 1:5].tolist(), arr[:, 0].astype(np.int64).tolist()
             
         except Exception as e:
             logger.warning(f"⚠️ Erro carregando label {label_path}: {str(e)}")
             return [], []
     
-    def _cache_all_images(self) -> None:
-        """Cache todas as imagens na memória."""
-        for i in range(len(self.image_paths)):
+    @staticmethod
+    def _parse_label_lines(label_path: Path) -> Tuple[List[List[float]], List[int]]:
+        """Parse linha a linha (labels com número de colunas variável)."""
+        bboxes = []
+        class_labels = []
+        
+        with open(label_path, 'r') as f:
+            lines = f.readlines()
+        
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            
+            parts = line.split()
+            if len(parts) < 5:
+                continue
+            
+            class_id = int(parts[0])
+            coords = [float(x) for x in parts[1:5]]
+            
+            bboxes.append(coords)
+            class_labels.append(class_id)
+        
+        return bboxes, class_labels
+    
+    def _label_cache_signature(self) -> str:
+        """Assinatura dos arquivos de labels (nome, mtime e tamanho)."""
+        digest = hashlib.sha1(f"v{_LABEL_CACHE_VERSION}\n".encode())
+        for img_path, label_path in zip(self.image_paths, self.label_paths):
+            if label_path is None:
+                digest.update(f"{img_path.stem}\0-\n".encode())
+                continue
+            st = os.stat(label_path)
+            digest.update(f"{label_path.name}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        return digest.hexdigest()
+    
+    def _init_label_cache(self) -> None:
+        """Carrega os labels do cache do split, refazendo o parse se estiver desatualizado."""
+        cache_path = self.data_path / f".{self.split}.labels.cache.npz"
+        signature = self._label_cache_signature()
+        
+        if cache_path.exists():
             try:
-                self._load_image(i)
+                with np.load(cache_path) as data:
+                    if str(data['signature']) == signature:
+                        self._label_rows = data['rows']
+                        self._label_offsets = data['offsets']
+                        return
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"⚠️ Cache de labels inválido ({e}); refazendo")
+        
+        n_images = len(self.image_paths)
+        offsets = np.zeros(n_images + 1, dtype=np.int64)
+        rows = []
+        for i in range(n_images):
+            bboxes, class_labels = self._read_label_file(i)
+            rows.extend([cls, *bbox] for cls, bbox in zip(class_labels, bboxes))
+            offsets[i + 1] = len(rows)
+        
+        self._label_rows = np.asarray(rows, dtype=np.float64).reshape(-1, 5)
+        self._label_offsets = offsets
+        
+        try:
+            tmp_path = cache_path.with_name(cache_path.name + '.tmp.npz')
+            np.savez(tmp_path, rows=self._label_rows, offsets=offsets,
+                     signature=np.array(signature))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Não foi possível salvar o cache de labels: {e}")
+    
+    def _disk_cache_signature(self) -> str:
+        """Assinatura da lista de imagens (caminho, mtime e tamanho)."""
+        digest = hashlib.sha1()
+        for img_path in self.image_paths:
+            st = os.stat(img_path)
+            digest.update(f"{img_path.name}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        return digest.hexdigest()
+    
+    def _init_disk_cache(self) -> None:
+        """Abre o cache em disco do split, (re)construindo se estiver desatualizado."""
+        bin_path = self.data_path / f".{self.split}.cache.bin"
+        index_path = self.data_path / f".{self.split}.cache.npz"
+        signature = self._disk_cache_signature()
+        
+        index = None
+        if bin_path.exists() and index_path.exists():
+            with np.load(index_path) as data:
+                if str(data['signature']) == signature:
+                    index = (data['offsets'], data['shapes'])
+        
+        if index is None:
+            logger.info("💾 Cacheando imagens em disco...")
+            index = self._build_disk_cache(bin_path, index_path, signature)
+        else:
+            logger.info(f"💾 Cache de imagens reaproveitado: {bin_path}")
+        
+        self._mm_offsets, self._mm_shapes = index
+        self._mm_path = bin_path
+    
+    def _build_disk_cache(
+        self, bin_path: Path, index_path: Path, signature: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Decodifica todas as imagens em sequência para um único arquivo."""
+        n_images = len(self.image_paths)
+        offsets = np.zeros(n_images + 1, dtype=np.int64)
+        shapes = np.full((n_images, 3), -1, dtype=np.int64)  # -1 = falhou
+        
+        tmp_path = bin_path.with_name(bin_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            position = 0
+            for i, img_path in enumerate(self.image_paths):
+                try:
+                    image = np.ascontiguousarray(_read_image_rgb(img_path))
+                    f.write(image.data)
+                    position += image.nbytes
+                    shapes[i] = image.shape
+                except Exception as e:
+                    logger.warning(f"⚠️ Erro cacheando imagem {i}: {str(e)}")
+                offsets[i + 1] = position
+                
                 if (i + 1) % 100 == 0:
-                    logger.info(f"💾 Cached {i + 1}/{len(self.image_paths)} imagens")
+                    logger.info(f"💾 Cached {i + 1}/{n_images} imagens")
+        
+        os.replace(tmp_path, bin_path)
+        # Índice por último: só é válido se o .bin estiver completo
+        tmp_index = index_path.with_name(index_path.name + '.tmp.npz')
+        np.savez(tmp_index, offsets=offsets, shapes=shapes,
+                 signature=np.array(signature))
+        os.replace(tmp_index, index_path)
+        
+        return offsets, shapes
+    
+    def _init_shared_cache(self) -> None:
+        """Decodifica todas as imagens para um bloco de memória compartilhada."""
+        n_images = len(self.image_paths)
+        offsets = np.zeros(n_images + 1, dtype=np.int64)
+        shapes = np.full((n_images, 3), -1, dtype=np.int64)  # -1 = falhou
+        
+        images = []
+        for i, img_path in enumerate(self.image_paths):
+            try:
+                image = np.ascontiguousarray(_read_image_rgb(img_path))
+                images.append(image)
+                shapes[i] = image.shape
+                offsets[i + 1] = offsets[i] + image.nbytes
             except Exception as e:
                 logger.warning(f"⚠️ Erro cacheando imagem {i}: {str(e)}")
+                offsets[i + 1] = offsets[i]
+            
+            if (i + 1) % 100 == 0:
+                logger.info(f"💾 Cached {i + 1}/{n_images} imagens")
+        
+        total = int(offsets[-1])
+        shm = SharedMemory(create=True, size=max(total, 1))
+        buf = np.ndarray((total,), dtype=np.uint8, buffer=shm.buf)
+        position = 0
+        for image in images:
+            buf[position:position + image.nbytes] = image.reshape(-1)
+            position += image.nbytes
+        buf.setflags(write=False)
+        
+        # Workers com fork herdam o mapeamento; com spawn, reabrem pelo nome
+        weakref.finalize(self, _release_shared_memory, shm, os.getpid())
+        self._shm = shm
+        self._shm_name = shm.name
+        self._mm = buf
+        self._mm_offsets, self._mm_shapes = offsets, shapes
+    
+    def _cache_view(self, idx: int) -> Optional[np.ndarray]:
+        """Imagem `idx` como view (zero-cópia, somente-leitura) do cache."""
+        shape = self._mm_shapes[idx]
+        if shape[0] < 0:
+            return None
+        
+        if self._mm is None:
+            if self._mm_offsets[-1] == 0:
+                return None  # np.memmap não aceita arquivo vazio
+            if self._mm_path is not None:
+                self._mm = np.memmap(self._mm_path, dtype=np.uint8, mode='r')
+            else:
+                self._shm = SharedMemory(name=self._shm_name)
+                self._mm = np.ndarray(
+                    (int(self._mm_offsets[-1]),), dtype=np.uint8, buffer=self._shm.buf)
+                self._mm.setflags(write=False)
+        
+        start, end = self._mm_offsets[idx], self._mm_offsets[idx + 1]
+        return self._mm[start:end].reshape(tuple(shape))
     
     def _get_fallback_item(self) -> Dict:
         """Retorna item de fallback em caso de erro."""
-        # Criar imagem preta
-        image = np.zeros((640, 640, 3), dtype=np.uint8)
+        image = self._FALLBACK_IMAGE
         
         if self.transforms:
             transformed = self.transforms(image=image)
@@ -237,12 +612,208 @@ class YOLODataset(Dataset):
         }
 
 
+def pack_dataset(
+    data_path: Union[str, Path],
+    out_path: Union[str, Path],
+    splits: Optional[List[str]] = None
+) -> Path:
+    """
+    Empacota um dataset YOLO em um único arquivo HDF5.
+
+    Cada split vira um grupo com os bytes originais das imagens (sem
+    recompressão), os labels (classe + bbox) e os nomes dos arquivos, de
+    modo que a leitura no treino é sequencial em um só arquivo.
+
+    Args:
+        data_path: Caminho do dataset (pasta com data.yaml)
+        out_path: Arquivo .h5 de saída
+        splits: Splits a empacotar (padrão: os presentes no data.yaml)
+
+    Returns:
+        Caminho do arquivo gerado
+    """
+    if h5py is None:
+        raise ImportError("h5py não instalado. Instale com: pip install h5py")
+    
+    data_path = Path(data_path)
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(data_path / 'data.yaml', 'r', encoding='utf-8') as f:
+        data_config = yaml.safe_load(f)
+    if splits is None:
+        splits = [s for s in ('train', 'val', 'test') if s in data_config]
+    
+    logger.info(f"📦 Empacotando dataset em {out_path}...")
+    
+    tmp_path = out_path.with_name(out_path.name + '.tmp')
+    with h5py.File(tmp_path, 'w') as f:
+        f.attrs['data_config'] = json.dumps(data_config)
+        
+        for split in splits:
+            dataset = YOLODataset(data_path, split=split)
+            n_images = len(dataset)
+            
+            group = f.create_group(split)
+            images = group.create_dataset(
+                'images', (n_images,), dtype=h5py.vlen_dtype(np.uint8))
+            labels = group.create_dataset(
+                'labels', (n_images,), dtype=h5py.vlen_dtype(np.float64))
+            group.create_dataset(
+                'names', data=[p.name for p in dataset.image_paths],
+                dtype=h5py.string_dtype())
+            
+            for i, img_path in enumerate(dataset.image_paths):
+                images[i] = np.frombuffer(img_path.read_bytes(), dtype=np.uint8)
+                bboxes, class_labels = dataset._load_labels(i)
+                rows = [[cls, *bbox] for cls, bbox in zip(class_labels, bboxes)]
+                labels[i] = np.asarray(rows, dtype=np.float64).reshape(-1)
+                
+                if (i + 1) % 1000 == 0:
+                    logger.info(f"📦 {split}: {i + 1}/{n_images} imagens")
+            
+            logger.info(f"✅ {split}: {n_images} imagens empacotadas")
+    
+    os.replace(tmp_path, out_path)
+    logger.success(f"✅ Dataset empacotado: {out_path}")
+    return out_path
+
+
+class H5YOLODataset(YOLODataset):
+    """
+    YOLODataset lido de um arquivo gerado por `pack_dataset`.
+
+    Imagem e labels de um item saem do mesmo arquivo; o handle HDF5 é
+    aberto sob demanda em cada processo (não sobrevive a fork/pickle).
+    """
+    
+    def __init__(
+        self,
+        h5_path: Union[str, Path],
+        split: str = 'train',
+        transforms=None,
+        task_type: str = 'detect',
+        decode_threads: int = 0
+    ):
+        if h5py is None:
+            raise ImportError("h5py não instalado. Instale com: pip install h5py")
+        
+        self.h5_path = Path(h5_path)
+        if not self.h5_path.exists():
+            raise DatasetNotFoundError(f"Arquivo HDF5 não encontrado: {self.h5_path}")
+        
+        self.data_path = self.h5_path.parent
+        self.split = split
+        self.transforms = transforms
+        self.task_type = task_type
+        self.cache_images = False
+        self.decode_threads = decode_threads
+        self._decode_pool: Optional[ThreadPoolExecutor] = None
+        self._h5 = None
+        
+        # Sem caches de pixels: os bytes já vêm de um único arquivo
+        self._mm = None
+        self._mm_path = None
+        self._mm_offsets = None
+        self._shm = None
+        
+        with h5py.File(self.h5_path, 'r') as f:
+            if split not in f:
+                raise DatasetNotFoundError(f"Split '{split}' não encontrado em {self.h5_path}")
+            self.data_config = json.loads(f.attrs['data_config'])
+            names = f[split]['names'].asstr()[()]
+        
+        self.image_paths = [Path(name) for name in names]
+        self.label_paths = [None] * len(self.image_paths)
+        
+        logger.info(f"📁 Dataset HDF5 carregado: {len(self.image_paths)} imagens ({split})")
+    
+    def __getstate__(self) -> Dict:
+        state = super().__getstate__()
+        state['_h5'] = None
+        return state
+    
+    def _group(self):
+        """Grupo do split no arquivo, aberto na primeira leitura do processo."""
+        if self._h5 is None:
+            self._h5 = h5py.File(self.h5_path, 'r')
+        return self._h5[self.split]
+    
+    def _load_image(self, idx: int) -> np.ndarray:
+        """Decodifica a imagem a partir dos bytes armazenados."""
+        buf = self._group()['images'][idx].tobytes()
+        try:
+            return _decode_image_bytes(buf)
+        except Exception:
+            image = _cv2_decode_rgb(np.frombuffer(buf, dtype=np.uint8))
+            if image is None:
+                raise CorruptedImageError(f"Imagem corrompida: {self.image_paths[idx]}")
+            return image
+    
+    def _load_labels(self, idx: int) -> Tuple[List[List[float]], List[int]]:
+        """Labels YOLO (classe + bbox) armazenados junto da imagem."""
+        arr = self._group()['labels'][idx].reshape(-1, 5)
+        return arr[:, 1:5].tolist(), arr[:, 0].astype(np.int64).tolist()
+
+
+def _worker_kwargs(num_workers: int, prefetch_factor: int) -> Dict:
+    """
+    Workers persistentes entre épocas, fila de prefetch mais funda e
+    OpenCV single-thread em cada worker.
+
+    Só se aplicam com `num_workers > 0` (o DataLoader rejeita com 0).
+    """
+    if num_workers <= 0:
+        return {}
+    return {
+        'persistent_workers': True,
+        'prefetch_factor': prefetch_factor,
+        'worker_init_fn': worker_init_opencv
+    }
+
+
+def _stack_images(images: List[torch.Tensor]) -> torch.Tensor:
+    """
+    Empilha as imagens do batch em um único tensor (B, C, H, W).
+
+    Dentro de um worker, o tensor de saída é alocado direto em memória
+    compartilhada (como no `default_collate`): o batch chega ao processo
+    principal sem a cópia extra feita ao serializá-lo.
+    """
+    out = None
+    if get_worker_info() is not None:
+        first = images[0]
+        storage = first._typed_storage()._new_shared(
+            len(images) * first.numel(), device=first.device)
+        out = first.new(storage).resize_(len(images), *first.shape)
+    return torch.stack(images, 0, out=out)
+
+
+def _auto_decode_threads(num_workers: int, max_threads: int = 4) -> int:
+    """Threads de decodificação por worker: divide os núcleos entre os workers."""
+    cpu_count = os.cpu_count() or 1
+    return max(1, min(max_threads, cpu_count // max(num_workers, 1)))
+
+
 class DataLoaderFactory:
     """Factory para criar DataLoaders."""
     
-    def __init__(self, data_path: Union[str, Path], task_type: str = 'detect'):
+    def __init__(
+        self,
+        data_path: Union[str, Path],
+        task_type: str = 'detect',
+        backend: str = 'torch'  # 'torch' ou 'dali'
+    ):
+        if backend not in ('torch', 'dali'):
+            raise ValueError(f"Backend '{backend}' inválido. Disponíveis: ['torch', 'dali']")
+        if backend == 'dali' and not DALI_AVAILABLE:
+            raise ImportError(
+                "NVIDIA DALI não instalado. Instale com: "
+                "pip install nvidia-dali-cuda120 --extra-index-url https://pypi.nvidia.com")
+        
         self.data_path = Path(data_path)
         self.task_type = task_type
+        self.backend = backend
         self.transforms = DataTransforms(task_type)
     
     def create_train_loader(
@@ -251,24 +822,50 @@ class DataLoaderFactory:
         num_workers: int = None,
         shuffle: bool = True,
         image_size: int = None,
-        cache_images: bool = False
-    ) -> DataLoader:
-        """Cria DataLoader para treinamento."""
+        cache_images: bool = False,
+        prefetch_factor: int = 4,
+        decode_threads: Optional[int] = None,
+        prefetch_to_gpu: bool = False,
+        device: Union[str, int, None] = None,
+        augment_on_gpu: bool = False
+    ) -> Union[DataLoader, 'CUDAPrefetcher']:
+        """
+        Cria DataLoader para treinamento.
+        
+        Com `prefetch_to_gpu=True` (e CUDA disponível) retorna um
+        `CUDAPrefetcher`, que entrega as imagens já no `device`.
+        `decode_threads=None` divide os núcleos da CPU entre os workers.
+        Com `augment_on_gpu=True` a CPU só redimensiona; o loop de treino
+        aplica `self.transforms.get_train_transforms_gpu()` em cada batch.
+        """
         
         if batch_size is None:
             batch_size = config.DEFAULT_BATCH_SIZE
         if num_workers is None:
             num_workers = 4
+        if decode_threads is None:
+            decode_threads = _auto_decode_threads(num_workers)
         if image_size is None:
             image_size = config.DEFAULT_IMG_SIZE
         
+        if self.backend == 'dali':
+            logger.warning("⚠️ Backend DALI: augmentations do Albumentations não são aplicadas")
+            return self._create_dali_loader('train', batch_size, image_size,
+                                            shuffle=shuffle, drop_last=True)
+        
+        if augment_on_gpu:
+            train_transforms = self.transforms.get_train_transforms_cpu_for_gpu(image_size)
+        else:
+            train_transforms = self.transforms.get_train_transforms(image_size)
+        
         # Dataset
         dataset = YOLODataset(
             data_path=self.data_path,
             split='train',
-            transforms=self.transforms.get_train_transforms(image_size),
+            transforms=train_transforms,
             task_type=self.task_type,
-            cache_images=cache_images
+            cache_images=cache_images,
+            decode_threads=decode_threads
         )
         
         # DataLoader
@@ -279,9 +876,13 @@ class DataLoaderFactory:
             num_workers=num_workers,
             pin_memory=torch.cuda.is_available(),
             collate_fn=self._collate_fn,
+            **_worker_kwargs(num_workers, prefetch_factor),
             drop_last=True  # Para consistência no batch size
         )
         
+        if prefetch_to_gpu and torch.cuda.is_available():
+            return CUDAPrefetcher(loader, device)
+        
         return loader
     
     def create_val_loader(
@@ -289,7 +890,9 @@ class DataLoaderFactory:
         batch_size: int = None,
         num_workers: int = None,
         image_size: int = None,
-        cache_images: bool = False
+        cache_images: bool = False,
+        prefetch_factor: int = 4,
+        decode_threads: Optional[int] = None
     ) -> DataLoader:
         """Cria DataLoader para validação."""
         
@@ -297,16 +900,23 @@ class DataLoaderFactory:
             batch_size = config.DEFAULT_BATCH_SIZE * 2  # Batch maior para validação
         if num_workers is None:
             num_workers = 4
+        if decode_threads is None:
+            decode_threads = _auto_decode_threads(num_workers)
         if image_size is None:
             image_size = config.DEFAULT_IMG_SIZE
         
+        if self.backend == 'dali':
+            return self._create_dali_loader('val', batch_size, image_size,
+                                            shuffle=False, drop_last=False)
+        
         # Dataset
         dataset = YOLODataset(
             data_path=self.data_path,
             split='val',
             transforms=self.transforms.get_val_transforms(image_size),
             task_type=self.task_type,
-            cache_images=cache_images
+            cache_images=cache_images,
+            decode_threads=decode_threads
         )
         
         # DataLoader
@@ -317,6 +927,7 @@ class DataLoaderFactory:
             num_workers=num_workers,
             pin_memory=torch.cuda.is_available(),
             collate_fn=self._collate_fn,
+            **_worker_kwargs(num_workers, prefetch_factor),
             drop_last=False
         )
         
@@ -326,7 +937,8 @@ class DataLoaderFactory:
         self,
         batch_size: int = 1,
         num_workers: int = 1,
-        image_size: int = None
+        image_size: int = None,
+        prefetch_factor: int = 4
     ) -> DataLoader:
         """Cria DataLoader para teste."""
         
@@ -350,11 +962,35 @@ class DataLoaderFactory:
             num_workers=num_workers,
             pin_memory=False,
             collate_fn=self._collate_fn,
+            **_worker_kwargs(num_workers, prefetch_factor),
             drop_last=False
         )
         
         return loader
     
+    def _create_dali_loader(
+        self,
+        split: str,
+        batch_size: int,
+        image_size: int,
+        shuffle: bool,
+        drop_last: bool
+    ) -> 'DALIYOLOLoader':
+        """Cria loader DALI (decodificação e letterbox na GPU)."""
+        dataset = YOLODataset(
+            data_path=self.data_path,
+            split=split,
+            transforms=None,
+            task_type=self.task_type
+        )
+        return DALIYOLOLoader(
+            dataset,
+            batch_size=batch_size,
+            image_size=image_size,
+            shuffle=shuffle,
+            drop_last=drop_last
+        )
+    
     def _collate_fn(self, batch: List[Dict]) -> Dict:
         """Função personalizada para agrupar itens do batch."""
         images = []
@@ -370,7 +1006,7 @@ class DataLoaderFactory:
         
         # Stack imagens se forem tensors
         if isinstance(images[0], torch.Tensor):
-            images = torch.stack(images)
+            images = _stack_images(images)
         
         return {
             'images': images,
@@ -380,6 +1016,173 @@ class DataLoaderFactory:
         }
 
 
+class CUDAPrefetcher:
+    """
+    Envolve um DataLoader e copia o próximo batch para a GPU em um stream separado.
+
+    Enquanto o passo de treino usa o batch atual, a cópia host->GPU do
+    seguinte (`non_blocking`, memória pinada) já está em andamento. Os
+    batches mantêm o formato do `_collate_fn`, com 'images' no device.
+    """
+    
+    def __init__(self, loader: DataLoader, device: Union[str, int, None] = None):
+        self.loader = loader
+        self.dataset = loader.dataset
+        self.device = torch.device('cuda' if device is None else device)
+        self.stream = torch.cuda.Stream(device=self.device)
+    
+    def __len__(self) -> int:
+        return len(self.loader)
+    
+    def _preload(self, loader_iter: Iterator) -> Optional[Dict]:
+        """Busca o próximo batch e inicia a cópia das imagens no stream lateral."""
+        batch = next(loader_iter, None)
+        if batch is not None and isinstance(batch['images'], torch.Tensor):
+            with torch.cuda.stream(self.stream):
+                batch['images'] = batch['images'].to(self.device, non_blocking=True)
+        return batch
+    
+    def __iter__(self) -> Iterator[Dict]:
+        loader_iter = iter(self.loader)
+        next_batch = self._preload(loader_iter)
+        
+        while next_batch is not None:
+            current_stream = torch.cuda.current_stream(self.device)
+            current_stream.wait_stream(self.stream)
+            
+            batch = next_batch
+            if isinstance(batch['images'], torch.Tensor):
+                # Memória alocada no stream lateral passa a ser usada no atual
+                batch['images'].record_stream(current_stream)
+            
+            next_batch = self._preload(loader_iter)
+            yield batch
+
+
+# Normalização ImageNet (a mesma do DataTransforms), na escala de pixels do DALI
+_DALI_MEAN = [0.485 * 255, 0.456 * 255, 0.406 * 255]
+_DALI_STD = [0.229 * 255, 0.224 * 255, 0.225 * 255]
+# Padding aplicado na saída normalizada: equivale ao pixel 0 do PadIfNeeded
+_DALI_PAD = [-m / sd for m, sd in zip(_DALI_MEAN, _DALI_STD)]
+
+
+if DALI_AVAILABLE:
+    @pipeline_def
+    def _dali_letterbox_pipeline(files: List[str], image_size: int, shuffle: bool):
+        """Lê, decodifica (nvJPEG), redimensiona e faz letterbox na GPU."""
+        encoded, indices = fn.readers.file(
+            files=files,
+            labels=list(range(len(files))),  # índice da imagem no dataset
+            random_shuffle=shuffle,
+            name='Reader'
+        )
+        shapes = fn.peek_image_shape(encoded)
+        images = fn.decoders.image(encoded, device='mixed', output_type=dali_types.RGB)
+        # LongestMaxSize + PadIfNeeded centralizado, como nos transforms de validação
+        images = fn.resize(images, mode='not_larger', size=[image_size, image_size])
+        images = fn.crop_mirror_normalize(
+            images,
+            dtype=dali_types.FLOAT,
+            output_layout='CHW',
+            crop=(image_size, image_size),
+            crop_pos_x=0.5,
+            crop_pos_y=0.5,
+            out_of_bounds_policy='pad',
+            fill_values=_DALI_PAD,
+            mean=_DALI_MEAN,
+            std=_DALI_STD
+        )
+        return images, shapes, indices
+
+
+class DALIYOLOLoader:
+    """
+    Loader alternativo com NVIDIA DALI: as imagens saem decodificadas na GPU.
+
+    Gera batches no mesmo formato do `_collate_fn` ('images' já no device,
+    bboxes YOLO ajustadas ao letterbox). Não aplica augmentations.
+    """
+    
+    def __init__(
+        self,
+        dataset: YOLODataset,
+        batch_size: int,
+        image_size: int,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        num_threads: int = 4,
+        device_id: int = 0,
+        seed: int = -1
+    ):
+        if not DALI_AVAILABLE:
+            raise ImportError("NVIDIA DALI não instalado")
+        
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.image_size = image_size
+        self.drop_last = drop_last
+        
+        pipe = _dali_letterbox_pipeline(
+            files=[str(p) for p in dataset.image_paths],
+            image_size=image_size,
+            shuffle=shuffle,
+            batch_size=batch_size,
+            num_threads=num_threads,
+            device_id=device_id,
+            seed=seed
+        )
+        pipe.build()
+        
+        self._iterator = DALIGenericIterator(
+            [pipe],
+            ['images', 'shapes', 'indices'],
+            reader_name='Reader',
+            last_batch_policy=LastBatchPolicy.DROP if drop_last else LastBatchPolicy.PARTIAL,
+            auto_reset=True
+        )
+    
+    def __len__(self) -> int:
+        n_images = len(self.dataset)
+        if self.drop_last:
+            return n_images // self.batch_size
+        return -(-n_images // self.batch_size)
+    
+    def _letterbox_bboxes(
+        self, bboxes: List[List[float]], height: int, width: int
+    ) -> List[List[float]]:
+        """Ajusta bboxes YOLO normalizadas ao redimensionamento + padding centralizado."""
+        size = self.image_size
+        scale = size / max(height, width)
+        new_w, new_h = round(width * scale), round(height * scale)
+        pad_x, pad_y = (size - new_w) / 2, (size - new_h) / 2
+        
+        return [
+            [(xc * new_w + pad_x) / size, (yc * new_h + pad_y) / size,
+             bw * new_w / size, bh * new_h / size]
+            for xc, yc, bw, bh in bboxes
+        ]
+    
+    def __iter__(self) -> Iterator[Dict]:
+        for outputs in self._iterator:
+            data = outputs[0]
+            shapes = data['shapes'].tolist()
+            indices = data['indices'].view(-1).tolist()
+            
+            all_bboxes = []
+            all_class_labels = []
+            for idx, (height, width, _) in zip(indices, shapes):
+                bboxes, class_labels = self.dataset._load_labels(idx)
+                all_bboxes.append(self._letterbox_bboxes(bboxes, height, width))
+                all_class_labels.append(class_labels)
+            
+            yield {
+                'images': data['images'],
+                'bboxes': all_bboxes,
+                'class_labels': all_class_labels,
+                'image_paths': [str(self.dataset.image_paths[idx]) for idx in indices]
+            }
+
+
 class InferenceDataLoader:
     """DataLoader simples para inferência."""
     
@@ -388,6 +1191,9 @@ class InferenceDataLoader:
         self.image_size = image_size or config.DEFAULT_IMG_SIZE
         self.transforms = DataTransforms(task_type)
         self.preprocessor = ImagePreprocessor()
+        # Pipeline montado uma vez (determinístico, seguro entre threads)
+        self._inference_pipe = self.transforms.get_inference_transforms(self.image_size)
+        self._pool: Optional[ThreadPoolExecutor] = None  # criado no primeiro batch
     
     def load_single_image(self, image_path: Union[str, Path]) -> Dict:
         """
@@ -406,16 +1212,11 @@ class InferenceDataLoader:
         
         # Carregar imagem
         try:
-            original_image = cv2.imread(str(image_path))
-            if original_image is None:
-                raise CorruptedImageError(f"Não foi possível carregar: {image_path}")
-            
-            original_image = cv2.cvtColor(original_image, cv2.COLOR_BGR2RGB)
+            original_image = _read_image_rgb(image_path)
             original_shape = original_image.shape[:2]  # (height, width)
             
             # Aplicar transformações
-            transforms = self.transforms.get_inference_transforms(self.image_size)
-            transformed = transforms(image=original_image)
+            transformed = self._inference_pipe(image=original_image)
             processed_image = transformed['image']
             
             return {
@@ -429,26 +1230,53 @@ class InferenceDataLoader:
             logger.error(f"❌ Erro processando imagem {image_path}: {str(e)}")
             raise
     
-    def load_image_batch(self, image_paths: List[Union[str, Path]]) -> List[Dict]:
+    def load_image_batch(self, image_paths: List[Union[str, Path]]) -> Dict:
         """
         Carrega batch de imagens para inferência.
         
+        As imagens são decodificadas e transformadas em paralelo (threads)
+        e empilhadas em um único tensor, em memória pinned quando há CUDA.
+        
         Args:
             image_paths: Lista de caminhos das imagens
         
         Returns:
-            Lista de dicts com imagens processadas
+            Dict com 'images' (tensor B x C x H x W), 'original_images',
+            'original_shapes' e 'image_paths' (imagens com erro são puladas)
         """
-        batch = []
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
         
-        for image_path in image_paths:
-            try:
-                item = self.load_single_image(image_path)
-                batch.append(item)
-            except Exception as e:
-                logger.warning(f"⚠️ Pulando imagem {image_path}: {str(e)}")
+        items = [
+            item for item in self._pool.map(self._try_load_single_image, image_paths)
+            if item is not None
+        ]
         
-        return batch
+        if items:
+            first = items[0]['image']
+            images = torch.empty(
+                (len(items), *first.shape),
+                dtype=first.dtype,
+                pin_memory=torch.cuda.is_available()
+            )
+            torch.stack([item['image'] for item in items], 0, out=images)
+        else:
+            images = torch.empty((0, 3, self.image_size, self.image_size))
+        
+        return {
+            'images': images,
+            'original_images': [item['original_image'] for item in items],
+            'original_shapes': [item['original_shape'] for item in items],
+            'image_paths': [item['image_path'] for item in items]
+        }
+    
+    def _try_load_single_image(self, image_path: Union[str, Path]) -> Optional[Dict]:
+        """`load_single_image` que registra o erro e retorna None."""
+        try:
+            return self.load_single_image(image_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Pulando imagem {image_path}: {str(e)}")
+            return None
     
     def load_from_directory(self, directory_path: Union[str, Path]) -> Iterator[Dict]:
         """
@@ -466,11 +1294,7 @@ class InferenceDataLoader:
             raise DatasetNotFoundError(f"Diretório não encontrado: {directory_path}")
         
         # Buscar imagens
-        image_paths = []
-        for ext in IMAGE_EXTENSIONS:
-            image_paths.extend(directory_path.glob(f"*{ext}"))
-        
-        image_paths.sort()
+        image_paths = _list_images(directory_path)
         
         logger.info(f"📁 Encontradas {len(image_paths)} imagens em {directory_path}")
         
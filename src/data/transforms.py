@@ -3,25 +3,105 @@
 Aplica transformações para treinamento e preprocessamento.
 """
 
-import random
+import os
+import threading
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union, Any
 import math
 
 import cv2
 import numpy as np
+import torch
 from PIL import Image, ImageEnhance, ImageFilter
 import albumentations as A
-from albumentations.pytorch import ToTensorV2
+from albumentations.core.transforms_interface import ImageOnlyTransform
 from loguru import logger
 
 from ..core.config import config
 from ..core.constants import COLORS
 from ..core.exceptions import ProcessingError
+from ._kernels import normalize_to_chw, warmup_normalize_kernel
+
+# Augmentações em batch na GPU (opcional): pip install kornia
+try:
+    import kornia.augmentation as K
+    KORNIA_AVAILABLE = True
+except ImportError:
+    KORNIA_AVAILABLE = False
+
+
+_rng_state: Dict[str, Any] = {'pid': None, 'rng': None}
+
+
+def _process_rng() -> np.random.Generator:
+    """
+    Generator NumPy do processo atual.
+
+    Recriado (com entropia do SO) quando o PID muda, para que os workers do
+    DataLoader, criados via fork, não herdem o mesmo estado e repitam as
+    mesmas augmentações.
+    """
+    pid = os.getpid()
+    if _rng_state['pid'] != pid:
+        _rng_state['rng'] = np.random.default_rng()
+        _rng_state['pid'] = pid
+    return _rng_state['rng']
+
+
+def worker_init_opencv(worker_id: int) -> None:
+    """
+    `worker_init_fn` do DataLoader: OpenCV single-thread dentro do worker.
+
+    O paralelismo fica a cargo dos workers; o pool de threads do OpenCV em
+    cada um deles só disputaria os mesmos núcleos. O processo principal
+    (inferência, pré-processamento de OCR) mantém o padrão do OpenCV.
+
+    Também prepara o kernel do `NormalizeToTensor` (numba) antes do primeiro
+    batch, em vez de na importação de src.data.
+    """
+    cv2.setNumThreads(0)
+    cv2.ocl.setUseOpenCL(False)
+    warmup_normalize_kernel()
+
+
+class NormalizeToTensor(ImageOnlyTransform):
+    """
+    `A.Normalize` + `ToTensorV2` fundidos em uma única passada.
+
+    Lê a imagem uint8 uma vez e escreve o tensor CxHxW float32 já
+    contíguo (sem o array HWC float32 intermediário).
+    """
+    
+    def __init__(
+        self,
+        mean: Tuple[float, ...] = (0.485, 0.456, 0.406),
+        std: Tuple[float, ...] = (0.229, 0.224, 0.225),
+        max_pixel_value: float = 255.0,
+        p: float = 1.0
+    ):
+        super().__init__(p=p)
+        self.mean = mean
+        self.std = std
+        self.max_pixel_value = max_pixel_value
+        # Mesma aritmética float32 do A.Normalize
+        self._mean = np.array(mean, dtype=np.float32) * np.float32(max_pixel_value)
+        self._inv_std = np.reciprocal(
+            np.array(std, dtype=np.float32) * np.float32(max_pixel_value))
+    
+    def apply(self, img: np.ndarray, **params) -> torch.Tensor:
+        return torch.from_numpy(normalize_to_chw(img, self._mean, self._inv_std))
+    
+    def get_transform_init_args_names(self) -> Tuple[str, ...]:
+        return ('mean', 'std', 'max_pixel_value')
 
 
 class DataTransforms:
-    """Classe principal para transformações de dados."""
+    """
+    Classe principal para transformações de dados.
+
+    Nos workers do DataLoader as transformações rodam com o OpenCV
+    single-thread (ver `worker_init_opencv`).
+    """
     
     def __init__(self, task_type: str = 'detect'):
         """
@@ -30,6 +110,8 @@ class DataTransforms:
         """
         self.task_type = task_type
         self.image_size = config.DEFAULT_IMG_SIZE
+        # Pipelines já montados, por (task_type, image_size, modo)
+        self._compose_cache: Dict[Tuple[str, int, str], A.Compose] = {}
     
     def get_train_transforms(self, image_size: int = None) -> A.Compose:
         """
@@ -44,6 +126,10 @@ class DataTransforms:
         if image_size is None:
             image_size = self.image_size
         
+        key = (self.task_type, image_size, 'train')
+        if key in self._compose_cache:
+            return self._compose_cache[key]
+        
         # Definir bbox_params baseado no tipo de tarefa
         if self.task_type == 'detect':
             bbox_params = A.BboxParams(
@@ -107,19 +193,63 @@ class DataTransforms:
             ),
             
             # Normalização (sempre por último)
-            A.Normalize(
-                mean=[0.485, 0.456, 0.406],
-                std=[0.229, 0.224, 0.225],
+            NormalizeToTensor(
+                mean=(0.485, 0.456, 0.406),
+                std=(0.229, 0.224, 0.225),
+                p=1.0
+            )
+        ]
+        
+        return self._compose_cache.setdefault(key, A.Compose(
+            transforms,
+            bbox_params=bbox_params,
+            p=1.0
+        ))
+    
+    def get_train_transforms_cpu_for_gpu(self, image_size: int = None) -> A.Compose:
+        """
+        Parte CPU do treino com augmentations na GPU (`GPUTransforms`).
+
+        Apenas redimensiona, faz padding e converte para tensor em [0, 1];
+        augmentations e normalização ficam para a GPU, sobre o batch.
+        """
+        if image_size is None:
+            image_size = self.image_size
+        
+        key = (self.task_type, image_size, 'train_gpu')
+        if key in self._compose_cache:
+            return self._compose_cache[key]
+        
+        if self.task_type == 'detect':
+            bbox_params = A.BboxParams(
+                format='yolo',
+                label_fields=['class_labels']
+            )
+        else:
+            bbox_params = None
+        
+        transforms = [
+            A.LongestMaxSize(max_size=image_size, p=1.0),
+            A.PadIfNeeded(
+                min_height=image_size,
+                min_width=image_size,
+                border_mode=cv2.BORDER_CONSTANT,
+                value=0,
                 p=1.0
             ),
-            ToTensorV2(p=1.0)
+            # Só escala para [0, 1] (média 0, desvio 1)
+            NormalizeToTensor(mean=(0.0, 0.0, 0.0), std=(1.0, 1.0, 1.0), p=1.0)
         ]
         
-        return A.Compose(
+        return self._compose_cache.setdefault(key, A.Compose(
             transforms,
             bbox_params=bbox_params,
             p=1.0
-        )
+        ))
+    
+    def get_train_transforms_gpu(self) -> 'GPUTransforms':
+        """Augmentations de treino em batch na GPU (Kornia)."""
+        return GPUTransforms()
     
     def get_val_transforms(self, image_size: int = None) -> A.Compose:
         """
@@ -134,6 +264,10 @@ class DataTransforms:
         if image_size is None:
             image_size = self.image_size
         
+        key = (self.task_type, image_size, 'val')
+        if key in self._compose_cache:
+            return self._compose_cache[key]
+        
         # Definir bbox_params baseado no tipo de tarefa
         if self.task_type == 'detect':
             bbox_params = A.BboxParams(
@@ -153,19 +287,18 @@ class DataTransforms:
                 value=0,
                 p=1.0
             ),
-            A.Normalize(
-                mean=[0.485, 0.456, 0.406],
-                std=[0.229, 0.224, 0.225],
+            NormalizeToTensor(
+                mean=(0.485, 0.456, 0.406),
+                std=(0.229, 0.224, 0.225),
                 p=1.0
-            ),
-            ToTensorV2(p=1.0)
+            )
         ]
         
-        return A.Compose(
+        return self._compose_cache.setdefault(key, A.Compose(
             transforms,
             bbox_params=bbox_params,
             p=1.0
-        )
+        ))
     
     def get_inference_transforms(self, image_size: int = None) -> A.Compose:
         """
@@ -180,6 +313,10 @@ class DataTransforms:
         if image_size is None:
             image_size = self.image_size
         
+        key = (self.task_type, image_size, 'inference')
+        if key in self._compose_cache:
+            return self._compose_cache[key]
+        
         transforms = [
             A.LongestMaxSize(max_size=image_size, p=1.0),
             A.PadIfNeeded(
@@ -189,21 +326,165 @@ class DataTransforms:
                 value=0,
                 p=1.0
             ),
-            A.Normalize(
-                mean=[0.485, 0.456, 0.406],
-                std=[0.229, 0.224, 0.225],
+            NormalizeToTensor(
+                mean=(0.485, 0.456, 0.406),
+                std=(0.229, 0.224, 0.225),
                 p=1.0
-            ),
-            ToTensorV2(p=1.0)
+            )
         ]
         
-        return A.Compose(transforms, p=1.0)
+        return self._compose_cache.setdefault(key, A.Compose(transforms, p=1.0))
+
+
+class GPUTransforms:
+    """
+    Augmentations de treino com Kornia, aplicadas ao batch já na GPU.
+
+    Equivalente aproximado das augmentations de `get_train_transforms`;
+    recebe o batch do DataLoader (imagens em [0, 1] vindas de
+    `get_train_transforms_cpu_for_gpu`) e devolve no mesmo formato, com
+    as imagens normalizadas e as bboxes YOLO ajustadas.
+    """
+    
+    def __init__(self, min_visibility: float = 0.3):
+        if not KORNIA_AVAILABLE:
+            raise ImportError("Kornia não instalado. Instale com: pip install kornia")
+        
+        self.min_visibility = min_visibility
+        self.augment = K.AugmentationSequential(
+            *self._build_augmentations(),
+            data_keys=['input', 'bbox_xywh']
+        )
+        # Batch sem nenhuma bbox (ex: segmentação)
+        self.augment_images = K.AugmentationSequential(
+            *self._build_augmentations(),
+            data_keys=['input']
+        )
+        self.normalize = K.Normalize(
+            mean=torch.tensor([0.485, 0.456, 0.406]),
+            std=torch.tensor([0.229, 0.224, 0.225])
+        )
+    
+    @staticmethod
+    def _build_augmentations() -> List:
+        """Augmentations na ordem (e probabilidades) do pipeline Albumentations."""
+        return [
+            # Geométricas
+            K.RandomAffine(degrees=10, translate=(0.1, 0.1), scale=(0.8, 1.2), p=0.5),
+            K.RandomHorizontalFlip(p=0.5),
+            
+            # Fotométricas
+            K.ColorJitter(brightness=0.2, contrast=0.2, saturation=0.25, hue=15 / 180, p=0.5),
+            K.RandomGamma(gamma=(0.8, 1.2), p=0.3),
+            
+            # Qualidade (ruído com desvio ~ sqrt(var 10-50) na escala 0-255)
+            K.RandomGaussianNoise(mean=0.0, std=0.025, p=0.3),
+            K.RandomGaussianBlur(kernel_size=(5, 5), sigma=(0.1, 2.0), p=0.2),
+            K.RandomMotionBlur(kernel_size=3, angle=35.0, direction=0.5, p=0.2),
+            
+            # Oclusão
+            K.RandomErasing(scale=(0.0005, 0.005), ratio=(0.5, 2.0), value=0.0, p=0.3)
+        ]
+    
+    def __call__(self, batch: Dict) -> Dict:
+        """
+        Args:
+            batch: Dict do DataLoader com 'images' (B x 3 x H x W, na GPU),
+                'bboxes' (YOLO normalizadas) e 'class_labels'
+
+        Returns:
+            Batch com imagens aumentadas/normalizadas e labels ajustados
+        """
+        images = batch['images']
+        n_images, _, height, width = images.shape
+        scale = images.new_tensor([width, height, width, height])
+        
+        # Bboxes YOLO -> xywh em pixels, com padding até o maior número por imagem
+        max_boxes = max((len(b) for b in batch['bboxes']), default=0)
+        if max_boxes == 0:
+            return {**batch, 'images': self.normalize(self.augment_images(images))}
+        
+        boxes = images.new_zeros((n_images, max_boxes, 4))
+        for i, bboxes in enumerate(batch['bboxes']):
+            if bboxes:
+                yolo = images.new_tensor(bboxes) * scale
+                boxes[i, :len(bboxes), :2] = yolo[:, :2] - yolo[:, 2:] / 2
+                boxes[i, :len(bboxes), 2:] = yolo[:, 2:]
+        
+        images, boxes = self.augment(images, boxes)
+        images = self.normalize(images)
+        
+        all_bboxes = []
+        all_class_labels = []
+        for i, (bboxes, class_labels) in enumerate(zip(batch['bboxes'], batch['class_labels'])):
+            kept_boxes, kept_labels = self._clip_boxes(
+                boxes[i, :len(bboxes)], class_labels, width, height)
+            all_bboxes.append(kept_boxes)
+            all_class_labels.append(kept_labels)
+        
+        return {
+            **batch,
+            'images': images,
+            'bboxes': all_bboxes,
+            'class_labels': all_class_labels
+        }
+    
+    def _clip_boxes(
+        self, boxes: torch.Tensor, class_labels: List[int], width: int, height: int
+    ) -> Tuple[List[List[float]], List[int]]:
+        """Recorta na imagem e descarta bboxes pouco visíveis (como o `min_visibility`)."""
+        if not class_labels:
+            return [], []
+        
+        x_min, y_min = boxes[:, 0], boxes[:, 1]
+        x_max, y_max = x_min + boxes[:, 2], y_min + boxes[:, 3]
+        area = boxes[:, 2] * boxes[:, 3]
+        
+        x_min, x_max = x_min.clamp(0, width), x_max.clamp(0, width)
+        y_min, y_max = y_min.clamp(0, height), y_max.clamp(0, height)
+        clipped_w, clipped_h = x_max - x_min, y_max - y_min
+        
+        keep = (clipped_w > 1) & (clipped_h > 1) & (
+            clipped_w * clipped_h >= self.min_visibility * area)
+        
+        yolo = torch.stack([
+            (x_min + x_max) / 2 / width,
+            (y_min + y_max) / 2 / height,
+            clipped_w / width,
+            clipped_h / height
+        ], dim=1)[keep]
+        
+        kept = keep.nonzero().flatten().tolist()
+        return yolo.tolist(), [class_labels[j] for j in kept]
+
+
+# Sharpen 3x3 misturado com a identidade (0.3 * original + 0.7 * sharpen) para
+# evitar over-sharpening, em um único filter2D. Apenas aproxima o antigo
+# filter2D + addWeighted: o intermediário não é mais saturado em 0-255, então
+# bordas de alto contraste saem um pouco mais fortes (não há igualdade byte a byte)
+_SHARPEN_ALPHA = 0.7
+_SHARPEN_BLEND_KERNEL = _SHARPEN_ALPHA * np.array([[-1, -1, -1],
+                                                   [-1, 9, -1],
+                                                   [-1, -1, -1]], dtype=np.float32)
+_SHARPEN_BLEND_KERNEL[1, 1] += 1 - _SHARPEN_ALPHA
+
+# Limiar fixo do binarize (method='fixed') como tabela: 0 abaixo de 128, 255 a partir dele
+_BINARY_LUT = np.where(np.arange(256) < 128, 0, 255).astype(np.uint8)
 
 
 class ImagePreprocessor:
     """Preprocessador de imagens para OCR e detecção."""
     
-    def __init__(self):
+    def __init__(self, ocr_quality: bool = False):
+        """
+        Args:
+            ocr_quality: Usa Non-local Means no denoise (muito mais lento);
+                por padrão usa filtro bilateral
+        """
+        self.ocr_quality = ocr_quality
+        # CLAHE reutilizado entre chamadas, um por thread: o objeto do OpenCV
+        # guarda estado interno, e a instância pode ser compartilhada
+        self._local = threading.local()
         self.methods = {
             'denoise': self.denoise,
             'enhance_contrast': self.enhance_contrast,
@@ -224,7 +505,8 @@ class ImagePreprocessor:
         Returns:
             Imagem preprocessada
         """
-        processed = image.copy()
+        # Nenhuma etapa altera a entrada (cada uma devolve um novo array)
+        processed = image
         
         # Crop ROI se bbox fornecida
         if bbox is not None:
@@ -239,12 +521,23 @@ class ImagePreprocessor:
         
         return processed
     
-    def denoise(self, image: np.ndarray) -> np.ndarray:
-        """Remove ruído da imagem."""
+    def denoise(self, image: np.ndarray, kernel_size: int = 3) -> np.ndarray:
+        """
+        Remove ruído da imagem.
+
+        Args:
+            image: Imagem original
+            kernel_size: Tamanho (ímpar) do blur gaussiano inicial. O
+                GaussianBlur do OpenCV é separável (custo linear no kernel)
+        """
         # Gaussian blur leve
-        blurred = cv2.GaussianBlur(image, (3, 3), 0)
+        blurred = cv2.GaussianBlur(image, (kernel_size, kernel_size), 0)
         
-        # Non-local means denoising
+        if not self.ocr_quality:
+            # Bilateral: suaviza preservando bordas, com janela local 9x9
+            return cv2.bilateralFilter(blurred, d=9, sigmaColor=50, sigmaSpace=50)
+        
+        # Non-local means denoising (busca em janela 21x21 por pixel)
         if len(image.shape) == 3:
             denoised = cv2.fastNlMeansDenoisingColored(blurred, None, 10, 10, 7, 21)
         else:
@@ -252,82 +545,144 @@ class ImagePreprocessor:
         
         return denoised
     
+    def _get_clahe(self) -> "cv2.CLAHE":
+        """CLAHE da thread atual (criado no primeiro uso)."""
+        clahe = getattr(self._local, 'clahe', None)
+        if clahe is None:
+            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+            self._local.clahe = clahe
+        return clahe
+    
     def enhance_contrast(self, image: np.ndarray) -> np.ndarray:
         """Melhora contraste da imagem."""
         # CLAHE (Contrast Limited Adaptive Histogram Equalization)
+        clahe = self._get_clahe()
         if len(image.shape) == 3:
             lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
             lab[:, :, 0] = clahe.apply(lab[:, :, 0])
-            enhanced = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
+            enhanced = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR, dst=lab)  # reusa o buffer LAB
         else:
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
             enhanced = clahe.apply(image)
         
         return enhanced
     
     def sharpen(self, image: np.ndarray) -> np.ndarray:
         """Aplica filtro de sharpening."""
-        kernel = np.array([[-1, -1, -1],
-                          [-1, 9, -1],
-                          [-1, -1, -1]])
-        
-        sharpened = cv2.filter2D(image, -1, kernel)
-        
-        # Blend com imagem original para evitar over-sharpening
-        alpha = 0.7
-        result = cv2.addWeighted(image, 1 - alpha, sharpened, alpha, 0)
-        
-        return result
+        # Filtro e blend com a original em um único passe
+        return cv2.filter2D(image, -1, _SHARPEN_BLEND_KERNEL)
     
-    def binarize(self, image: np.ndarray) -> np.ndarray:
-        """Binariza imagem usando Otsu."""
+    def binarize(self, image: np.ndarray, method: str = 'otsu') -> np.ndarray:
+        """
+        Binariza imagem.
+
+        Args:
+            image: Imagem original
+            method: 'otsu' (limiar pelo histograma), 'fixed' (limiar 128 via
+                LUT, sem histograma; indicado após CLAHE) ou 'adaptive'
+                (limiar gaussiano local)
+        """
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
-        
-        # Otsu thresholding
-        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            gray = image  # threshold só lê a imagem
+        
+        if method == 'otsu':
+            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        elif method == 'fixed':
+            # Escreve sobre o cinza quando ele já é um buffer próprio
+            binary = cv2.LUT(gray, _BINARY_LUT, dst=gray if gray is not image else None)
+        elif method == 'adaptive':
+            binary = cv2.adaptiveThreshold(
+                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+            )
+        else:
+            raise ValueError(
+                f"Método de binarização inválido: {method}. Use 'otsu', 'fixed' ou 'adaptive'"
+            )
         
         return binary
     
-    def deskew(self, image: np.ndarray) -> np.ndarray:
-        """Corrige inclinação do texto."""
+    def deskew(self, image: np.ndarray, method: str = 'hough') -> np.ndarray:
+        """
+        Corrige inclinação do texto.
+
+        Args:
+            image: Imagem original
+            method: 'hough' (linhas detectadas) ou 'gradient' (histograma de
+                orientação dos gradientes; mais rápido em scans grandes)
+        """
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            gray = image  # Canny só lê a imagem
+        
+        if method == 'gradient':
+            median_angle = self._skew_from_gradients(gray)
+        elif method == 'hough':
+            median_angle = self._skew_from_hough(gray)
+        else:
+            raise ValueError(f"Método de deskew inválido: {method}. Use 'hough' ou 'gradient'")
         
+        if median_angle is None:
+            return image
+        
+        # Rotacionar imagem
+        h, w = image.shape[:2]
+        center = (w // 2, h // 2)
+        M = cv2.getRotationMatrix2D(center, median_angle, 1.0)
+        
+        rotated = cv2.warpAffine(
+            image, M, (w, h),
+            flags=cv2.INTER_CUBIC,
+            borderMode=cv2.BORDER_REPLICATE
+        )
+        
+        return rotated
+    
+    @staticmethod
+    def _skew_from_hough(gray: np.ndarray) -> Optional[float]:
+        """Ângulo mediano das linhas de Hough (None se nenhuma linha)."""
         # Detectar linhas usando Hough Transform
         edges = cv2.Canny(gray, 50, 150, apertureSize=3)
         lines = cv2.HoughLines(edges, 1, np.pi/180, threshold=100)
         
-        if lines is not None:
-            # Calcular ângulo médio das linhas
-            angles = []
-            for rho, theta in lines[:, 0]:
-                angle = theta * 180 / np.pi - 90
-                if abs(angle) < 45:  # Filtrar ângulos razoáveis
-                    angles.append(angle)
-            
-            if angles:
-                median_angle = np.median(angles)
-                
-                # Rotacionar imagem
-                h, w = image.shape[:2]
-                center = (w // 2, h // 2)
-                M = cv2.getRotationMatrix2D(center, median_angle, 1.0)
-                
-                rotated = cv2.warpAffine(
-                    image, M, (w, h),
-                    flags=cv2.INTER_CUBIC,
-                    borderMode=cv2.BORDER_REPLICATE
-                )
-                
-                return rotated
-        
-        return image
+        if lines is None:
+            return None
+        
+        # Calcular ângulo médio das linhas (vetorizado sobre todas as linhas)
+        angles = lines[:, 0, 1] * 180 / np.pi - 90
+        angles = angles[np.abs(angles) < 45]  # Filtrar ângulos razoáveis
+        
+        if not angles.size:
+            return None
+        return float(np.median(angles))
+    
+    @staticmethod
+    def _skew_from_gradients(gray: np.ndarray, max_side: int = 512) -> Optional[float]:
+        """Ângulo mediano da orientação dos 10% gradientes mais fortes (None se imagem lisa)."""
+        scale = max_side / max(gray.shape[:2])
+        if scale < 1:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        
+        # Borrar funde os caracteres de cada linha de texto: os gradientes
+        # fortes passam a vir das bordas das linhas, não do traço das letras
+        gray = cv2.GaussianBlur(gray, (0, 0), 2)
+        
+        gx = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=3)
+        gy = cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=3)
+        magnitude = cv2.magnitude(gx, gy)
+        
+        flat = magnitude.ravel()
+        kth = int(flat.size * 0.9)
+        threshold = np.partition(flat, kth)[kth]
+        mask = magnitude > max(threshold, 0)
+        if not mask.any():
+            return None
+        
+        # Mesma convenção do Hough: normal da borda, módulo 90° em [-45, 45)
+        angles = np.degrees(np.arctan2(gy[mask], gx[mask]))
+        angles = (angles + 45) % 90 - 45
+        return float(np.median(angles))
     
     def crop_roi(self, image: np.ndarray, bbox: List[float]) -> np.ndarray:
         """
@@ -365,8 +720,14 @@ class ImagePreprocessor:
 class MosaicAugmentation:
     """Implementação customizada de Mosaic Augmentation."""
     
-    def __init__(self, mosaic_prob: float = 0.5):
+    def __init__(self, mosaic_prob: float = 0.5, seed: Optional[int] = None):
+        """
+        Args:
+            mosaic_prob: Probabilidade de aplicar o mosaic
+            seed: Semente do gerador (None = gerador do processo)
+        """
         self.mosaic_prob = mosaic_prob
+        self._rng = np.random.default_rng(seed) if seed is not None else None
     
     def __call__(self, images_batch: List[np.ndarray], labels_batch: List[List]) -> Tuple[np.ndarray, List]:
         """
@@ -379,12 +740,13 @@ class MosaicAugmentation:
         Returns:
             Tuple (imagem_mosaic, labels_ajustados)
         """
-        if random.random() > self.mosaic_prob or len(images_batch) < 4:
+        rng = self._rng or _process_rng()
+        if rng.random() > self.mosaic_prob or len(images_batch) < 4:
             # Retornar primeira imagem sem modificação
             return images_batch[0], labels_batch[0]
         
         # Selecionar 4 imagens aleatoriamente
-        indices = random.sample(range(len(images_batch)), 4)
+        indices = rng.choice(len(images_batch), 4, replace=False)
         selected_images = [images_batch[i] for i in indices]
         selected_labels = [labels_batch[i] for i in indices]
         
@@ -415,35 +777,52 @@ class MosaicAugmentation:
             (mosaic_size // 2, mosaic_size // 2)  # Bottom-right
         ]
         
-        mosaic_labels = []
-        
-        for i, (img, pos, labels_list) in enumerate(zip(resized_images, positions, labels)):
-            x_offset, y_offset = pos
-            
+        for img, (x_offset, y_offset) in zip(resized_images, positions):
             # Colocar imagem no mosaic
             mosaic[y_offset:y_offset + mosaic_size // 2,
                    x_offset:x_offset + mosaic_size // 2] = img
-            
-            # Ajustar labels
-            for label in labels_list:
-                if len(label) >= 5:  # class x_center y_center width height
-                    class_id = label[0]
-                    x_center, y_center, width, height = label[1:5]
-                    
-                    # Ajustar coordenadas para o quadrante
-                    new_x_center = (x_center * (mosaic_size // 2) + x_offset) / mosaic_size
-                    new_y_center = (y_center * (mosaic_size // 2) + y_offset) / mosaic_size
-                    new_width = width * 0.5
-                    new_height = height * 0.5
-                    
-                    # Verificar se bbox ainda está dentro da imagem
-                    if (0 < new_x_center < 1 and 0 < new_y_center < 1 and
-                        new_width > 0.01 and new_height > 0.01):
-                        
-                        adjusted_label = [class_id, new_x_center, new_y_center, new_width, new_height]
-                        mosaic_labels.append(adjusted_label)
+        
+        mosaic_labels = self._adjust_labels(labels, positions, mosaic_size)
         
         return mosaic, mosaic_labels
+    
+    @staticmethod
+    def _adjust_labels(
+        labels: List[List],
+        positions: List[Tuple[int, int]],
+        mosaic_size: int
+    ) -> List[List]:
+        """Leva os labels dos 4 quadrantes para o mosaic (vetorizado, todas as bboxes de uma vez)."""
+        # class x_center y_center width height
+        rows = [
+            (label, pos)
+            for labels_list, pos in zip(labels, positions)
+            for label in labels_list
+            if len(label) >= 5
+        ]
+        if not rows:
+            return []
+        
+        coords = np.array([label[1:5] for label, _ in rows], dtype=np.float64)
+        offsets = np.array([pos for _, pos in rows], dtype=np.float64)
+        half = mosaic_size // 2
+        
+        # Ajustar coordenadas para o quadrante
+        adjusted = np.empty_like(coords)
+        adjusted[:, :2] = (coords[:, :2] * half + offsets) / mosaic_size
+        adjusted[:, 2:] = coords[:, 2:] * 0.5
+        
+        # Verificar se bbox ainda está dentro da imagem
+        keep = (
+            (adjusted[:, 0] > 0) & (adjusted[:, 0] < 1) &
+            (adjusted[:, 1] > 0) & (adjusted[:, 1] < 1) &
+            (adjusted[:, 2] > 0.01) & (adjusted[:, 3] > 0.01)
+        )
+        
+        return [
+            [rows[i][0][0], *adjusted[i].tolist()]
+            for i in np.flatnonzero(keep)
+        ]
 
 
 # ========================================
@@ -486,22 +865,45 @@ def resize_with_padding(image: np.ndarray, target_size: int) -> Tuple[np.ndarray
     return canvas, scale
 
 
-def apply_random_transforms(image: np.ndarray, p: float = 0.5) -> np.ndarray:
-    """Aplica transformações aleatórias simples."""
-    if random.random() < p:
-        # Brightness
-        alpha = random.uniform(0.8, 1.2)
-        image = cv2.convertScaleAbs(image, alpha=alpha, beta=0)
+_IDENTITY_LUT = np.arange(256, dtype=np.uint8)
+
+
+def apply_random_transforms(
+    image: np.ndarray,
+    p: float = 0.5,
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Aplica transformações aleatórias simples.
+
+    Args:
+        image: Imagem original
+        p: Probabilidade de cada transformação
+        rng: Gerador NumPy (None = gerador do processo)
+    """
+    rng = rng or _process_rng()
+    # Todos os sorteios da amostra de uma vez
+    coins = rng.random(3)
+    alphas = rng.uniform(0.8, 1.2, 2)
+    
+    # Brightness e contrast compostos em uma única tabela (um passe na imagem)
+    lut = None
+    for coin, alpha in zip(coins[:2], alphas):
+        if coin < p:
+            lut = cv2.convertScaleAbs(_IDENTITY_LUT if lut is None else lut, alpha=float(alpha), beta=0)
     
-    if random.random() < p:
-        # Contrast
-        alpha = random.uniform(0.8, 1.2)
-        image = cv2.convertScaleAbs(image, alpha=alpha, beta=0)
+    owned = lut is not None  # a imagem já é um buffer novo (não é a entrada)
+    if owned:
+        image = cv2.LUT(image, lut)
     
-    if random.random() < p:
-        # Gaussian noise
-        noise = np.random.normal(0, 10, image.shape).astype(np.uint8)
-        image = cv2.add(image, noise)
+    if coins[2] < p:
+        # Gaussian noise (int16: valores negativos escurecem em vez de estourar)
+        # Semente do RNG do OpenCV tirada do gerador: ruído reprodutível e
+        # diferente entre workers
+        cv2.setRNGSeed(int(rng.integers(2**31)))
+        noise = np.empty(image.shape, dtype=np.int16)
+        cv2.randn(noise.reshape(-1, 1), 0, 10)
+        image = cv2.add(image, noise, dst=image if owned else None, dtype=cv2.CV_8U)
     
     return image
 
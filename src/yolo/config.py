@@ -115,7 +115,7 @@ class TrainingConfig:
     # Training settings
     patience: int = 50
     workers: int = 4
-    cache: bool = False
+    cache: Union[bool, str] = False  # True/'ram', 'disk' ou False
     save: bool = True
     save_period: int = 10
     exist_ok: bool = True